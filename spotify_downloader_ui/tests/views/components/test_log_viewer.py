@@ -0,0 +1,52 @@
+"""
+Tests for the LogViewer component.
+"""
+
+import unittest
+
+from spotify_downloader_ui.views.components.log_viewer import LogViewer, LogLevel
+from spotify_downloader_ui.tests.test_utils import MockConfigService, MockErrorService, get_application
+
+class TestLogViewer(unittest.TestCase):
+    """Test case for LogViewer component."""
+
+    def setUp(self):
+        """Set up the test case."""
+        self.app = get_application()
+        self.viewer = LogViewer(MockConfigService(), MockErrorService())
+
+    def tearDown(self):
+        """Clean up the test case."""
+        self.viewer.deleteLater()
+
+    def _display_lines(self):
+        """Get the text and visibility of each log display line."""
+        lines = []
+        block = self.viewer.log_display.document().firstBlock()
+        while block.isValid():
+            lines.append((block.text(), block.isVisible()))
+            block = block.next()
+        return lines
+
+    def test_collapse_after_group_evicted(self):
+        """Test that collapsing a group evicted before a rebuild leaves other lines alone."""
+        viewer = self.viewer
+        viewer.start_group("G")
+        for i in range(5):
+            viewer.add_log_entry(LogLevel.INFO, f"grouped {i}")
+        viewer.end_group()
+        for i in range(viewer.max_entries):
+            viewer.add_log_entry(LogLevel.INFO, f"plain {i}")
+
+        # A filter change rebuilds the display from the remaining entries
+        viewer.level_combo.setCurrentIndex(1)
+        viewer.level_combo.setCurrentIndex(0)
+        before = self._display_lines()
+
+        viewer._on_collapse_all()
+
+        self.assertEqual(self._display_lines(), before)
+        self.assertTrue(all(visible for _, visible in before))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,7 +9,7 @@ from .enhanced_progress_bar import EnhancedProgressBar
 from .time_estimator import TimeEstimator
 from .process_visualization import ProcessVisualization, ProcessStage
 from .completion_animation import (
-    CompletionAnimation, CheckmarkAnimation, CrossAnimation, SpinnerAnimation
+    CompletionAnimation, StatusAnimation, CheckmarkAnimation, CrossAnimation, SpinnerAnimation
 )
 from .error_visualization import ErrorVisualization
 from .phase_indicator import PhaseIndicator, AnimatedPhaseIndicator
@@ -34,6 +34,7 @@ __all__ = [
     'ProcessVisualization',
     'ProcessStage',
     'CompletionAnimation',
+    'StatusAnimation',
     'CheckmarkAnimation',
     'CrossAnimation',
     'SpinnerAnimation',
@@ -6,51 +6,174 @@ successfully or encounters an error.
 """
 
 import logging
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Callable, Tuple
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGraphicsOpacityEffect,
     QFrame, QSizePolicy
 )
 from PySide6.QtCore import (
     Qt, Signal, Slot, QPropertyAnimation, QParallelAnimationGroup,
-    QSequentialAnimationGroup, QEasingCurve, QSize, QTimer, QRect, QPoint, Property
+    QSequentialAnimationGroup, QSize, QTimer, QRect, QPoint, QPointF, Property,
+    QObject, QElapsedTimer, QLineF
 )
 from PySide6.QtGui import (
     QPainter, QPainterPath, QPen, QBrush, QColor, QFont, QPaintEvent,
-    QLinearGradient, QRadialGradient
+    QLinearGradient, QRadialGradient, QPixmap
 )
 
 logger = logging.getLogger(__name__)
 
-class CheckmarkAnimation(QWidget):
-    """Animated checkmark for successful completion."""
+
+class _AnimScheduler(QObject):
+    """Single timer that drives every running checkmark/cross animation."""
     
     def __init__(self, parent=None):
-        """Initialize the checkmark animation widget.
+        """Initialize the scheduler.
+        
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        
+        # Callback -> (start time in ms, duration in ms)
+        self._entries: Dict[Callable[[float], None], Tuple[int, int]] = {}
+        
+        self._clock = QElapsedTimer()
+        self._clock.start()
+        
+        self._timer = QTimer(self)
+        self._timer.setInterval(16)  # ~60fps
+        self._timer.timeout.connect(self._tick)
+    
+    def register(self, callback: Callable[[float], None], duration: int):
+        """Start driving a callback with eased progress from 0.0 to 1.0.
+        
+        Args:
+            callback: Called with the eased progress on every tick
+            duration: Animation duration in milliseconds
+        """
+        self._entries[callback] = (self._clock.elapsed(), duration)
+        if not self._timer.isActive():
+            self._timer.start()
+    
+    def unregister(self, callback: Callable[[float], None]):
+        """Stop driving a callback.
+        
+        Args:
+            callback: Previously registered callback
+        """
+        self._entries.pop(callback, None)
+        if not self._entries:
+            self._timer.stop()
+    
+    @Slot()
+    def _tick(self):
+        """Advance all registered animations."""
+        now = self._clock.elapsed()
+        for callback, (start, duration) in list(self._entries.items()):
+            t = min(1.0, (now - start) / duration)
+            try:
+                # OutCubic easing
+                callback(1.0 - (1.0 - t) ** 3)
+            except RuntimeError:
+                # Underlying widget was deleted
+                t = 1.0
+            if t >= 1.0:
+                self._entries.pop(callback, None)
+        
+        if not self._entries:
+            self._timer.stop()
+
+
+_scheduler: Optional[_AnimScheduler] = None
+
+
+def _get_scheduler() -> _AnimScheduler:
+    """Get the shared animation scheduler, creating it on first use.
+    
+    Returns:
+        Shared animation scheduler
+    """
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = _AnimScheduler()
+    return _scheduler
+
+
+def _circle_rect(width: int, height: int, stroke_width: int) -> QRect:
+    """Get the bounding rect of an animation circle.
+    
+    Args:
+        width: Widget width
+        height: Widget height
+        stroke_width: Stroke width of the animation
+        
+    Returns:
+        Rect covering the circle including the stroke
+    """
+    radius = min(width, height) / 2 - stroke_width
+    extent = int(radius) + stroke_width
+    return QRect(int(width / 2) - extent, int(height / 2) - extent, 2 * extent, 2 * extent)
+
+
+class StatusAnimation(QWidget):
+    """Animated status indicator drawing a checkmark, cross or spinner."""
+    
+    # Animation states
+    STATE_SUCCESS = 1
+    STATE_ERROR = 2
+    STATE_LOADING = 3
+    
+    # Fraction of the progress spent growing the background circle
+    _CIRCLE_PHASE = {STATE_SUCCESS: 0.5, STATE_ERROR: 0.3}
+    
+    def __init__(self, state: int = STATE_SUCCESS, parent=None):
+        """Initialize the status animation widget.
         
         Args:
+            state: Initial animation state
             parent: Parent widget
         """
         super().__init__(parent)
         
         # Animation properties
+        self._state = state
         self._stroke_width = 3
-        self._color = QColor(76, 175, 80)  # Green
+        self._colors = {
+            self.STATE_SUCCESS: QColor(76, 175, 80),   # Green
+            self.STATE_ERROR: QColor(244, 67, 54),     # Red
+            self.STATE_LOADING: QColor(33, 150, 243),  # Blue
+        }
         self._progress = 0.0
+        self._last_quantized = -1
+        self._rotation = 0.0
         self._size = 100
+        self._is_running = False
         
         # Set fixed size
         self.setFixedSize(self._size, self._size)
+        self._dirty_rect = _circle_rect(self._size, self._size, self._stroke_width)
+        
+        # Checkmark/cross duration in ms; progress is driven by the shared scheduler
+        self._duration = 800
+        
+        # Setup timer for continuous spinner rotation
+        self._timer = QTimer(self)
+        self._timer.setInterval(16)  # ~60fps
+        self._timer.timeout.connect(self._update_rotation)
+        
+        # Static circle background, shown once the circle has finished growing
+        self._circle_label = QLabel(self)
+        self._circle_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self._circle_label.hide()
+        
+        # Spinner ring rendered once and rotated on paint
+        self._seg_brushes: List[QBrush] = []
+        self._pixmap: Optional[QPixmap] = None
         
-        # Setup animation
-        self._animation = QPropertyAnimation(self, b"progress")
-        self._animation.setDuration(800)
-        self._animation.setStartValue(0.0)
-        self._animation.setEndValue(1.0)
-        self._animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        self._animation.valueChanged.connect(self.update)
+        self._rebuild_caches()
         
-        logger.debug("Checkmark animation initialized")
+        logger.debug("Status animation initialized")
     
     def sizeHint(self) -> QSize:
         """Get the recommended size for the widget."""
@@ -60,170 +183,171 @@ class CheckmarkAnimation(QWidget):
         """Get the minimum recommended size for the widget."""
         return QSize(50, 50)
     
-    def set_color(self, color: QColor):
-        """Set the checkmark color.
+    def state(self) -> int:
+        """Get the current animation state.
         
-        Args:
-            color: Color to use
+        Returns:
+            One of the STATE_* constants
         """
-        self._color = color
-        self.update()
+        return self._state
     
-    def get_progress(self) -> float:
-        """Get the current progress.
+    def set_state(self, state: int):
+        """Switch to another animation state.
         
-        Returns:
-            Progress value between 0.0 and 1.0
+        Args:
+            state: One of the STATE_* constants
         """
-        return self._progress
+        if state == self._state:
+            return
+        
+        self.stop()
+        self._state = state
+        self._progress = 0.0
+        self._last_quantized = -1
+        self._circle_label.hide()
+        self._rebuild_caches()
+        self.update()
     
-    def set_progress(self, value: float):
-        """Set the progress value.
+    def set_color(self, color: QColor):
+        """Set the color used by the current state.
         
         Args:
-            value: Progress value between 0.0 and 1.0
+            color: Color to use
         """
-        self._progress = value
+        self._colors[self._state] = color
+        self._rebuild_caches()
         self.update()
     
-    progress = Property(float, get_progress, set_progress)
-    
-    def start(self):
-        """Start the animation."""
-        self._animation.stop()
-        self._progress = 0.0
-        self._animation.start()
-    
-    def paintEvent(self, event: QPaintEvent):
-        """Handle paint event.
+    def resizeEvent(self, event):
+        """Handle resize event.
         
         Args:
-            event: Paint event
+            event: Resize event
         """
-        painter = QPainter(self)
+        super().resizeEvent(event)
+        self._dirty_rect = _circle_rect(self.width(), self.height(), self._stroke_width)
+        self._rebuild_caches()
+    
+    def _rebuild_caches(self):
+        """Rebuild the color- and size-dependent drawing caches for the current state."""
+        if self._state == self.STATE_LOADING:
+            self._build_segment_brushes()
+            self._pixmap = None
+        else:
+            self._render_circle()
+            self._build_stroke_geometry()
+    
+    def _build_segment_brushes(self):
+        """Precompute the opacity-graded brush for each spinner segment."""
+        color = self._colors[self.STATE_LOADING]
+        red, green, blue = color.red(), color.green(), color.blue()
+        self._seg_brushes = [
+            QBrush(QColor(red, green, blue, int(255 * (0.2 + (i / 8) * 0.8))))
+            for i in range(8)
+        ]
+    
+    def _build_stroke_geometry(self):
+        """Precompute the checkmark or cross segments, full path and pen."""
+        center_x = self.width() / 2
+        center_y = self.height() / 2
+        radius = min(self.width(), self.height()) / 2 - self._stroke_width
+        
+        self._stroke_path = QPainterPath()
+        if self._state == self.STATE_SUCCESS:
+            # Bottom, middle and top of the checkmark
+            point1 = QPointF(center_x - radius * 0.3, center_y + radius * 0.2)
+            point2 = QPointF(center_x - radius * 0.1, center_y + radius * 0.4)
+            point3 = QPointF(center_x + radius * 0.4, center_y - radius * 0.3)
+            
+            self._stroke_lines = (QLineF(point1, point2), QLineF(point2, point3))
+            self._stroke_path.moveTo(point1)
+            self._stroke_path.lineTo(point2)
+            self._stroke_path.lineTo(point3)
+        else:
+            # Top left to bottom right, then top right to bottom left
+            offset = radius * 0.5
+            self._stroke_lines = (
+                QLineF(center_x - offset, center_y - offset, center_x + offset, center_y + offset),
+                QLineF(center_x + offset, center_y - offset, center_x - offset, center_y + offset),
+            )
+            for line in self._stroke_lines:
+                self._stroke_path.moveTo(line.p1())
+                self._stroke_path.lineTo(line.p2())
+        
+        self._stroke_pen = QPen(self._colors[self._state], self._stroke_width, Qt.PenStyle.SolidLine, 
+                                Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin)
+    
+    def _render_circle(self):
+        """Render the full alpha circle into the background label."""
+        width = self.width()
+        height = self.height()
+        ratio = self.devicePixelRatioF()
+        radius = min(width, height) / 2 - self._stroke_width
+        
+        # 20% alpha encoded directly as an integer
+        color = self._colors[self._state]
+        self._bg_color = QColor.fromRgb(color.red(), color.green(), color.blue(), 51)
+        self._bg_brush = QBrush(self._bg_color)
+        
+        pixmap = QPixmap(int(width * ratio), int(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._bg_brush)
+        painter.drawEllipse(QPoint(int(width / 2), int(height / 2)), 
+                           int(radius), int(radius))
+        painter.end()
         
-        # Get widget dimensions
+        self._circle_label.setGeometry(0, 0, width, height)
+        self._circle_label.setPixmap(pixmap)
+    
+    def _build_pixmap(self):
+        """Rasterize the spinner ring at zero rotation into a cached pixmap."""
         width = self.width()
         height = self.height()
+        ratio = self.devicePixelRatioF()
+        
+        pixmap = QPixmap(int(width * ratio), int(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
         
         # Calculate center and radius
         center_x = width / 2
         center_y = height / 2
         radius = min(width, height) / 2 - self._stroke_width
         
-        # Draw circle background with alpha
-        if self._progress < 0.5:
-            # Scale circle from 0 to 1
-            circle_progress = min(1.0, self._progress * 2)
-            circle_radius = radius * circle_progress
-            
-            # Draw growing circle
-            painter.setPen(Qt.PenStyle.NoPen)
-            bg_color = QColor(self._color)
-            bg_color.setAlphaF(0.2)
-            painter.setBrush(QBrush(bg_color))
-            painter.drawEllipse(QPoint(int(center_x), int(center_y)), 
-                               int(circle_radius), int(circle_radius))
-            
-        else:
-            # Circle is complete, draw with full radius
-            painter.setPen(Qt.PenStyle.NoPen)
-            bg_color = QColor(self._color)
-            bg_color.setAlphaF(0.2)
-            painter.setBrush(QBrush(bg_color))
-            painter.drawEllipse(QPoint(int(center_x), int(center_y)), 
-                               int(radius), int(radius))
-            
-            # Draw checkmark
-            checkmark_progress = min(1.0, (self._progress - 0.5) * 2)
-            
-            # Calculate checkmark points
-            # Bottom of checkmark
-            point1_x = center_x - radius * 0.3
-            point1_y = center_y + radius * 0.2
-            
-            # Middle of checkmark
-            point2_x = center_x - radius * 0.1
-            point2_y = center_y + radius * 0.4
+        # Draw spinner segments with varying opacity
+        for i in range(8):
+            painter.setBrush(self._seg_brushes[i])
             
-            # Top of checkmark
-            point3_x = center_x + radius * 0.4
-            point3_y = center_y - radius * 0.3
+            # Create circular segment
+            path = QPainterPath()
+            path.moveTo(center_x, center_y)
+            path.arcTo(int(center_x - radius), int(center_y - radius), 
+                      int(radius * 2), int(radius * 2), 
+                      i * 45 - 20, 40)
+            path.closeSubpath()
             
-            # Calculate actual points based on progress
-            if checkmark_progress <= 0.5:
-                # First line segment (normalized to 0-1 range)
-                first_progress = checkmark_progress * 2
-                current_x = point1_x + (point2_x - point1_x) * first_progress
-                current_y = point1_y + (point2_y - point1_y) * first_progress
-                
-                # Draw first segment
-                pen = QPen(self._color, self._stroke_width, Qt.PenStyle.SolidLine, 
-                          Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin)
-                painter.setPen(pen)
-                painter.drawLine(int(point1_x), int(point1_y), int(current_x), int(current_y))
-            else:
-                # Draw complete first segment
-                pen = QPen(self._color, self._stroke_width, Qt.PenStyle.SolidLine, 
-                          Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin)
-                painter.setPen(pen)
-                painter.drawLine(int(point1_x), int(point1_y), int(point2_x), int(point2_y))
-                
-                # Draw second segment (normalized to 0-1 range)
-                second_progress = (checkmark_progress - 0.5) * 2
-                current_x = point2_x + (point3_x - point2_x) * second_progress
-                current_y = point2_y + (point3_y - point2_y) * second_progress
-                
-                painter.drawLine(int(point2_x), int(point2_y), int(current_x), int(current_y))
-
-
-class CrossAnimation(QWidget):
-    """Animated cross/X for failure or error states."""
-    
-    def __init__(self, parent=None):
-        """Initialize the cross animation widget.
-        
-        Args:
-            parent: Parent widget
-        """
-        super().__init__(parent)
-        
-        # Animation properties
-        self._stroke_width = 3
-        self._color = QColor(244, 67, 54)  # Red
-        self._progress = 0.0
-        self._size = 100
-        
-        # Set fixed size
-        self.setFixedSize(self._size, self._size)
-        
-        # Setup animation
-        self._animation = QPropertyAnimation(self, b"progress")
-        self._animation.setDuration(800)
-        self._animation.setStartValue(0.0)
-        self._animation.setEndValue(1.0)
-        self._animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        self._animation.valueChanged.connect(self.update)
+            painter.drawPath(path)
         
-        logger.debug("Cross animation initialized")
-    
-    def sizeHint(self) -> QSize:
-        """Get the recommended size for the widget."""
-        return QSize(self._size, self._size)
-    
-    def minimumSizeHint(self) -> QSize:
-        """Get the minimum recommended size for the widget."""
-        return QSize(50, 50)
+        painter.end()
+        self._pixmap = pixmap
     
-    def set_color(self, color: QColor):
-        """Set the cross color.
+    def _stroke_rect(self) -> QRect:
+        """Get the bounding rect of the checkmark or cross strokes.
         
-        Args:
-            color: Color to use
+        Returns:
+            Rect covering the strokes including the pen width
         """
-        self._color = color
-        self.update()
+        pad = self._stroke_width + 1
+        return self._stroke_path.boundingRect().toAlignedRect().adjusted(-pad, -pad, pad, pad)
     
     def get_progress(self) -> float:
         """Get the current progress.
@@ -240,15 +364,57 @@ class CrossAnimation(QWidget):
             value: Progress value between 0.0 and 1.0
         """
         self._progress = value
-        self.update()
+        
+        if self._state == self.STATE_LOADING:
+            return
+        
+        # Skip invalidation when the change stays within the same pixel
+        quantized = round(value * min(self.width(), self.height()))
+        if quantized == self._last_quantized and value < 1.0:
+            return
+        self._last_quantized = quantized
+        
+        # Once the circle is complete only the strokes change
+        if value >= self._CIRCLE_PHASE[self._state]:
+            if self._circle_label.isHidden():
+                self._circle_label.show()
+                self.update()
+            else:
+                self.update(self._stroke_rect())
+        else:
+            self._circle_label.hide()
+            self.update(self._dirty_rect)
     
     progress = Property(float, get_progress, set_progress)
     
+    @Slot()
+    def _update_rotation(self):
+        """Update the spinner rotation angle."""
+        self._rotation = (self._rotation + 5) % 360
+        self.update(self._dirty_rect)
+    
     def start(self):
         """Start the animation."""
-        self._animation.stop()
+        if self._state == self.STATE_LOADING:
+            if not self._is_running:
+                self._is_running = True
+                self._timer.start()
+            return
+        
+        scheduler = _get_scheduler()
+        scheduler.unregister(self.set_progress)
         self._progress = 0.0
-        self._animation.start()
+        self._last_quantized = -1
+        self._circle_label.hide()
+        scheduler.register(self.set_progress, self._duration)
+    
+    def stop(self):
+        """Stop the animation."""
+        if self._is_running:
+            self._is_running = False
+            self._timer.stop()
+        if _scheduler is not None:
+            _scheduler.unregister(self.set_progress)
     
     def paintEvent(self, event: QPaintEvent):
         """Handle paint event.
@@ -256,200 +422,117 @@ class CrossAnimation(QWidget):
         Args:
             event: Paint event
         """
+        # Skip exposes that don't touch the circle
+        if not event.rect().intersects(self._dirty_rect):
+            return
+        
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setClipRegion(event.region())
         
-        # Get widget dimensions
-        width = self.width()
-        height = self.height()
+        if self._state == self.STATE_LOADING:
+            self._paint_spinner(painter)
+            return
         
-        # Calculate center and radius
-        center_x = width / 2
-        center_y = height / 2
-        radius = min(width, height) / 2 - self._stroke_width
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Draw circle background with alpha
-        if self._progress < 0.3:
-            # Scale circle from 0 to 1
-            circle_progress = min(1.0, self._progress * (1.0 / 0.3))
-            circle_radius = radius * circle_progress
-            
-            # Draw growing circle
-            painter.setPen(Qt.PenStyle.NoPen)
-            bg_color = QColor(self._color)
-            bg_color.setAlphaF(0.2)
-            painter.setBrush(QBrush(bg_color))
-            painter.drawEllipse(QPoint(int(center_x), int(center_y)), 
-                               int(circle_radius), int(circle_radius))
-            
+        circle_end = self._CIRCLE_PHASE[self._state]
+        if self._progress < circle_end:
+            self._paint_circle(painter, self._progress / circle_end)
         else:
-            # Circle is complete, draw with full radius
-            painter.setPen(Qt.PenStyle.NoPen)
-            bg_color = QColor(self._color)
-            bg_color.setAlphaF(0.2)
-            painter.setBrush(QBrush(bg_color))
-            painter.drawEllipse(QPoint(int(center_x), int(center_y)), 
-                               int(radius), int(radius))
-            
-            # Draw X
-            cross_progress = min(1.0, (self._progress - 0.3) * (1.0 / 0.7))
-            
-            # Calculate X points
-            offset = radius * 0.5
-            top_left_x = center_x - offset
-            top_left_y = center_y - offset
-            bottom_right_x = center_x + offset
-            bottom_right_y = center_y + offset
-            
-            top_right_x = center_x + offset
-            top_right_y = center_y - offset
-            bottom_left_x = center_x - offset
-            bottom_left_y = center_y + offset
-            
-            # Setup pen
-            pen = QPen(self._color, self._stroke_width, Qt.PenStyle.SolidLine, 
-                      Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin)
-            painter.setPen(pen)
-            
-            # Draw X based on progress
-            if cross_progress <= 0.5:
-                # First line - top left to bottom right
-                first_progress = cross_progress * 2
-                current_right_x = top_left_x + (bottom_right_x - top_left_x) * first_progress
-                current_right_y = top_left_y + (bottom_right_y - top_left_y) * first_progress
-                
-                painter.drawLine(int(top_left_x), int(top_left_y), 
-                                int(current_right_x), int(current_right_y))
-            else:
-                # First line - complete
-                painter.drawLine(int(top_left_x), int(top_left_y), 
-                                int(bottom_right_x), int(bottom_right_y))
-                
-                # Second line - top right to bottom left
-                second_progress = (cross_progress - 0.5) * 2
-                current_left_x = top_right_x + (bottom_left_x - top_right_x) * second_progress
-                current_left_y = top_right_y + (bottom_left_y - top_right_y) * second_progress
-                
-                painter.drawLine(int(top_right_x), int(top_right_y), 
-                                int(current_left_x), int(current_left_y))
-
-
-class SpinnerAnimation(QWidget):
-    """Animated spinner for loading/busy states."""
+            # Circle is complete and drawn by the background label
+            self._paint_strokes(painter, min(1.0, (self._progress - circle_end) / (1.0 - circle_end)))
     
-    def __init__(self, parent=None):
-        """Initialize the spinner animation widget.
+    def _paint_circle(self, painter: QPainter, circle_progress: float):
+        """Draw the growing background circle.
         
         Args:
-            parent: Parent widget
+            painter: Active painter
+            circle_progress: Circle scale between 0.0 and 1.0
         """
-        super().__init__(parent)
-        
-        # Animation properties
-        self._stroke_width = 3
-        self._color = QColor(33, 150, 243)  # Blue
-        self._rotation = 0.0
-        self._size = 100
-        self._is_running = False
+        radius = min(self.width(), self.height()) / 2 - self._stroke_width
+        circle_radius = int(radius * circle_progress)
         
-        # Set fixed size
-        self.setFixedSize(self._size, self._size)
-        
-        # Setup timer for continuous rotation
-        self._timer = QTimer(self)
-        self._timer.setInterval(16)  # ~60fps
-        self._timer.timeout.connect(self._update_rotation)
-        
-        logger.debug("Spinner animation initialized")
-    
-    def sizeHint(self) -> QSize:
-        """Get the recommended size for the widget."""
-        return QSize(self._size, self._size)
-    
-    def minimumSizeHint(self) -> QSize:
-        """Get the minimum recommended size for the widget."""
-        return QSize(50, 50)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._bg_brush)
+        painter.drawEllipse(QPoint(int(self.width() / 2), int(self.height() / 2)), 
+                           circle_radius, circle_radius)
     
-    def set_color(self, color: QColor):
-        """Set the spinner color.
+    def _paint_strokes(self, painter: QPainter, stroke_progress: float):
+        """Draw the checkmark or cross strokes.
         
         Args:
-            color: Color to use
+            painter: Active painter
+            stroke_progress: Stroke progress between 0.0 and 1.0
         """
-        self._color = color
-        self.update()
-    
-    def _update_rotation(self):
-        """Update the rotation angle."""
-        self._rotation = (self._rotation + 5) % 360
-        self.update()
-    
-    def start(self):
-        """Start the animation."""
-        if not self._is_running:
-            self._is_running = True
-            self._timer.start()
-    
-    def stop(self):
-        """Stop the animation."""
-        if self._is_running:
-            self._is_running = False
-            self._timer.stop()
+        painter.setPen(self._stroke_pen)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        first_line, second_line = self._stroke_lines
+        
+        if stroke_progress >= 1.0:
+            # Finished shape
+            painter.drawPath(self._stroke_path)
+        elif stroke_progress <= 0.5:
+            # First line segment (normalized to 0-1 range)
+            painter.drawLine(QLineF(first_line.p1(), first_line.pointAt(stroke_progress * 2)))
+        else:
+            # Complete first segment, then the second (normalized to 0-1 range)
+            painter.drawLine(first_line)
+            second_progress = (stroke_progress - 0.5) * 2
+            painter.drawLine(QLineF(second_line.p1(), second_line.pointAt(second_progress)))
     
-    def paintEvent(self, event: QPaintEvent):
-        """Handle paint event.
+    def _paint_spinner(self, painter: QPainter):
+        """Draw the rotated spinner ring.
         
         Args:
-            event: Paint event
+            painter: Active painter
         """
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if self._pixmap is None:
+            self._build_pixmap()
+        
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
         
-        # Get widget dimensions
+        # Rotate the cached ring about the center (arc angles run counter-clockwise)
         width = self.width()
         height = self.height()
+        painter.translate(width / 2, height / 2)
+        painter.rotate(-self._rotation)
+        painter.drawPixmap(QPointF(-width / 2, -height / 2), self._pixmap)
+
+
+class CheckmarkAnimation(StatusAnimation):
+    """Animated checkmark for successful completion."""
+    
+    def __init__(self, parent=None):
+        """Initialize the checkmark animation widget.
         
-        # Calculate center and radius
-        center_x = width / 2
-        center_y = height / 2
-        radius = min(width, height) / 2 - self._stroke_width
+        Args:
+            parent: Parent widget
+        """
+        super().__init__(StatusAnimation.STATE_SUCCESS, parent)
+
+
+class CrossAnimation(StatusAnimation):
+    """Animated cross/X for failure or error states."""
+    
+    def __init__(self, parent=None):
+        """Initialize the cross animation widget.
         
-        # Set up pen
-        painter.setPen(Qt.PenStyle.NoPen)
+        Args:
+            parent: Parent widget
+        """
+        super().__init__(StatusAnimation.STATE_ERROR, parent)
+
+
+class SpinnerAnimation(StatusAnimation):
+    """Animated spinner for loading/busy states."""
+    
+    def __init__(self, parent=None):
+        """Initialize the spinner animation widget.
         
-        # Draw spinner segments with varying opacity
-        for i in range(8):
-            # Calculate angle
-            angle = (self._rotation + i * 45) % 360
-            
-            # Calculate opacity based on position
-            opacity = 0.2 + ((i / 8) * 0.8)
-            
-            # Set color with opacity
-            color = QColor(self._color)
-            color.setAlphaF(opacity)
-            painter.setBrush(QBrush(color))
-            
-            # Draw arc segment
-            start_angle = angle - 20
-            span = 40
-            
-            # Create circular segment
-            path = QPainterPath()
-            path.moveTo(center_x, center_y)
-            
-            # Convert angles to Qt's 16th of a degree units
-            start_angle16 = int(start_angle * 16)
-            span16 = int(span * 16)
-            
-            # Add arc to path
-            path.arcTo(int(center_x - radius), int(center_y - radius), 
-                      int(radius * 2), int(radius * 2), 
-                      start_angle, span)
-            path.closeSubpath()
-            
-            # Draw path
-            painter.drawPath(path)
+        Args:
+            parent: Parent widget
+        """
+        super().__init__(StatusAnimation.STATE_LOADING, parent)
 
 
 class CompletionAnimation(QWidget):
@@ -459,9 +542,9 @@ class CompletionAnimation(QWidget):
     animation_finished = Signal()
     
     # Animation states
-    STATE_SUCCESS = 1
-    STATE_ERROR = 2
-    STATE_LOADING = 3
+    STATE_SUCCESS = StatusAnimation.STATE_SUCCESS
+    STATE_ERROR = StatusAnimation.STATE_ERROR
+    STATE_LOADING = StatusAnimation.STATE_LOADING
     
     def __init__(self, parent=None):
         """Initialize the completion animation widget.
@@ -474,15 +557,18 @@ class CompletionAnimation(QWidget):
         # Animation state
         self._state = self.STATE_SUCCESS
         self._message = ""
+        self._fading_out = False
         
         self._init_ui()
         
-        # Set up opacity animation for fade in/out
-        self._opacity_effect = QGraphicsOpacityEffect(self)
-        self._opacity_effect.setOpacity(0.0)
-        self.setGraphicsEffect(self._opacity_effect)
+        # Start fully transparent; the opacity effect only lives while fading
+        # or hidden, so steady-state paints skip the offscreen pass
+        opacity_effect = QGraphicsOpacityEffect(self)
+        opacity_effect.setOpacity(0.0)
+        self.setGraphicsEffect(opacity_effect)
         
-        self._opacity_animation = QPropertyAnimation(self._opacity_effect, b"opacity")
+        # Target is chosen per fade in _fade()
+        self._opacity_animation = QPropertyAnimation(self)
         self._opacity_animation.setDuration(500)
         self._opacity_animation.finished.connect(self._on_animation_finished)
         
@@ -495,26 +581,14 @@ class CompletionAnimation(QWidget):
         layout.setSpacing(10)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        # Animation container
-        animation_frame = QFrame()
-        animation_layout = QVBoxLayout(animation_frame)
-        animation_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # Animation container; the animation is created on first use
+        self.animation_frame = QFrame()
+        self.animation_layout = QVBoxLayout(self.animation_frame)
+        self.animation_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        # Create all animations but only show the active one
-        self.checkmark = CheckmarkAnimation()
-        self.cross = CrossAnimation()
-        self.spinner = SpinnerAnimation()
+        self.status_animation: Optional[StatusAnimation] = None
         
-        # Initially hide all
-        self.checkmark.hide()
-        self.cross.hide()
-        self.spinner.hide()
-        
-        animation_layout.addWidget(self.checkmark)
-        animation_layout.addWidget(self.cross)
-        animation_layout.addWidget(self.spinner)
-        
-        layout.addWidget(animation_frame)
+        layout.addWidget(self.animation_frame)
         
         # Message label
         self.message_label = QLabel()
@@ -528,6 +602,32 @@ class CompletionAnimation(QWidget):
         
         layout.addWidget(self.message_label)
     
+    def _ensure_status_animation(self) -> StatusAnimation:
+        """Get the status animation, creating it if needed.
+        
+        Returns:
+            Status animation widget
+        """
+        if self.status_animation is None:
+            self.status_animation = StatusAnimation(self._state)
+            self.animation_layout.addWidget(self.status_animation)
+        return self.status_animation
+    
+    def _switch_status_animation(self) -> StatusAnimation:
+        """Switch the status animation to the current state.
+        
+        Updates on the animation frame are suspended so the switch is
+        painted once.
+        
+        Returns:
+            Status animation widget
+        """
+        self.animation_frame.setUpdatesEnabled(False)
+        status_animation = self._ensure_status_animation()
+        status_animation.set_state(self._state)
+        self.animation_frame.setUpdatesEnabled(True)
+        return status_animation
+    
     def set_message(self, message: str):
         """Set the message text.
         
@@ -547,11 +647,8 @@ class CompletionAnimation(QWidget):
         if message:
             self.set_message(message)
         
-        # Show checkmark, hide others
-        self.checkmark.show()
-        self.cross.hide()
-        self.spinner.hide()
-        self.spinner.stop()
+        # Switch to the checkmark
+        self._switch_status_animation()
         
         # Start animation
         self._start_animation()
@@ -566,11 +663,8 @@ class CompletionAnimation(QWidget):
         if message:
             self.set_message(message)
         
-        # Show cross, hide others
-        self.checkmark.hide()
-        self.cross.show()
-        self.spinner.hide()
-        self.spinner.stop()
+        # Switch to the cross
+        self._switch_status_animation()
         
         # Start animation
         self._start_animation()
@@ -585,44 +679,66 @@ class CompletionAnimation(QWidget):
         if message:
             self.set_message(message)
         
-        # Show spinner, hide others
-        self.checkmark.hide()
-        self.cross.hide()
-        self.spinner.show()
-        
-        # Start spinner animation
-        self.spinner.start()
+        # Switch to the spinner and start it
+        self._switch_status_animation().start()
         
         # Fade in
-        self._opacity_animation.setStartValue(0.0)
-        self._opacity_animation.setEndValue(1.0)
-        self._opacity_animation.start()
+        self._fade(0.0, 1.0)
     
     def hide_animation(self):
         """Hide the animation with fade out effect."""
-        self._opacity_animation.setStartValue(1.0)
-        self._opacity_animation.setEndValue(0.0)
+        self._fade(1.0, 0.0)
+    
+    def _fade(self, start: float, end: float):
+        """Animate the widget opacity.
+        
+        Top-level widgets fade via windowOpacity; embedded widgets use a
+        temporary QGraphicsOpacityEffect.
+        
+        Args:
+            start: Start opacity
+            end: End opacity
+        """
+        self._opacity_animation.stop()
+        self._fading_out = end < start
+        
+        if self.isWindow():
+            self.setGraphicsEffect(None)
+            self._opacity_animation.setTargetObject(self)
+            self._opacity_animation.setPropertyName(b"windowOpacity")
+        else:
+            effect = self.graphicsEffect()
+            if effect is None:
+                effect = QGraphicsOpacityEffect(self)
+                effect.setOpacity(start)
+                self.setGraphicsEffect(effect)
+            self._opacity_animation.setTargetObject(effect)
+            self._opacity_animation.setPropertyName(b"opacity")
+        
+        self._opacity_animation.setStartValue(start)
+        self._opacity_animation.setEndValue(end)
         self._opacity_animation.start()
     
     def _start_animation(self):
         """Start the appropriate animation based on state."""
         # Fade in
-        self._opacity_animation.setStartValue(0.0)
-        self._opacity_animation.setEndValue(1.0)
-        self._opacity_animation.start()
+        self._fade(0.0, 1.0)
         
-        # Start specific animation
-        if self._state == self.STATE_SUCCESS:
-            self.checkmark.start()
-        elif self._state == self.STATE_ERROR:
-            self.cross.start()
+        # Start the checkmark/cross animation
+        self.status_animation.start()
     
+    @Slot()
     def _on_animation_finished(self):
         """Handle animation finished event."""
-        # Only emit signal when completely hidden
-        if self._opacity_effect.opacity() < 0.1:
-            self.animation_finished.emit()
-            
-            # Stop spinner if it was running
-            if self._state == self.STATE_LOADING:
-                self.spinner.stop() 
\ No newline at end of file
+        # Fade-in finished: drop the effect so later paints render directly
+        if not self._fading_out:
+            if not self.isWindow():
+                self.setGraphicsEffect(None)
+            return
+        
+        # Fade-out finished: the widget is completely hidden
+        self.animation_finished.emit()
+        
+        # Stop spinner if it was running
+        if self._state == self.STATE_LOADING and self.status_animation is not None:
+            self.status_animation.stop()
@@ -9,27 +9,35 @@ This component extends the base Qt progress bar with:
 """
 
 import logging
+import re
 from typing import Dict, List, Optional, Union, Tuple
 from PySide6.QtWidgets import (
-    QProgressBar, QWidget, QHBoxLayout, QLabel, QSizePolicy
+    QProgressBar, QWidget, QHBoxLayout, QLabel, QSizePolicy, QApplication
 )
 from PySide6.QtCore import (
     Qt, Signal, Slot, Property, QPropertyAnimation, 
-    QEasingCurve, QSize, QTimer
+    QEasingCurve, QSize, QTimer, QRect, QEvent, QAbstractAnimation, QVariantAnimation
 )
 from PySide6.QtGui import (
     QPainter, QLinearGradient, QBrush, QPen, QColor, QFont,
-    QPalette, QFontMetrics
+    QPalette, QFontMetrics, QPixmap, QTransform
 )
 
 logger = logging.getLogger(__name__)
 
+# Matches the %p/%v/%m placeholders in a progress text format
+_FORMAT_FIELD_RE = re.compile(r"%([pvm])")
+
 class EnhancedProgressBar(QWidget):
     """Enhanced progress bar with animations and customizable appearance."""
     
     # Signal when progress changes
     progress_changed = Signal(int)
     
+    # Shared pen for borderless fills
+    _NO_PEN = QPen(Qt.PenStyle.NoPen)
+    _INDET_EDGE_COLOR = QColor(240, 240, 240)
+    
     def __init__(self, parent=None):
         """Initialize the enhanced progress bar.
         
@@ -50,11 +58,22 @@ class EnhancedProgressBar(QWidget):
         self._animation.setEasingCurve(QEasingCurve.Type.OutCubic)
         self._animation.setDuration(500)  # 500ms duration
         
-        # Indeterminate animation
-        self._indeterminate_position = 0
-        self._indeterminate_timer = QTimer(self)
-        self._indeterminate_timer.setInterval(16)  # ~60fps
-        self._indeterminate_timer.timeout.connect(self._update_indeterminate)
+        # Coalesces bursts of setValue calls into one animation step per frame
+        self._pending_value: Optional[int] = None
+        self._value_timer = QTimer(self)
+        self._value_timer.setSingleShot(True)
+        self._value_timer.setInterval(16)
+        self._value_timer.timeout.connect(self._apply_pending_value)
+        
+        # Indeterminate animation, ticked by Qt's animation driver;
+        # position runs from 0.0 to 1.0 once per sweep
+        self._indeterminate_position = 0.0
+        self._indeterminate_animation = QVariantAnimation(self)
+        self._indeterminate_animation.setStartValue(0.0)
+        self._indeterminate_animation.setEndValue(1.0)
+        self._indeterminate_animation.setDuration(2400)
+        self._indeterminate_animation.setLoopCount(-1)
+        self._indeterminate_animation.valueChanged.connect(self._update_indeterminate)
         
         # Appearance properties
         self._background_color = QColor(240, 240, 240)
@@ -64,12 +83,30 @@ class EnhancedProgressBar(QWidget):
         self._use_gradient = True
         self._gradient_color1 = QColor(42, 130, 218)
         self._gradient_color2 = QColor(32, 100, 200)
+        # False while the gradient still has to be derived from _progress_color
+        self._gradient_overridden = True
         self._text_visible = True
         self._text_format = "%p%"
+        self._format_tokens = self._compile_format(self._text_format)
         self._height = 24
         self._border_radius = 4
         self._custom_text = ""
         
+        # Cached paint objects, rebuilt when colors or size change
+        self._border_pen: Optional[QPen] = None
+        self._background_brush: Optional[QBrush] = None
+        self._text_pen: Optional[QPen] = None
+        self._determinate_brush: Optional[QBrush] = None
+        self._indeterminate_brush: Optional[QBrush] = None
+        self._frame_pixmap: Optional[QPixmap] = None
+        self._gradient_dirty = True
+        
+        # Rendered text and its width, reused while the inputs are unchanged
+        self._cached_text = ""
+        self._cached_text_key: tuple = ()
+        self._cached_text_width = 0
+        self._font_metrics = QFontMetrics(self.font())
+        
         # Layout 
         self._init_ui()
         
@@ -79,6 +116,11 @@ class EnhancedProgressBar(QWidget):
             QSizePolicy.Policy.Fixed
         )
         
+        # Pause animations while the whole application is hidden
+        app = QApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(self._on_application_state_changed)
+        
         logger.debug("Enhanced progress bar initialized")
     
     def _init_ui(self):
@@ -97,6 +139,86 @@ class EnhancedProgressBar(QWidget):
         """Get the minimum recommended size for the widget."""
         return QSize(100, self._height)
     
+    def showEvent(self, event):
+        """Handle show event.
+        
+        Args:
+            event: Show event
+        """
+        super().showEvent(event)
+        self._resume_animations()
+    
+    def hideEvent(self, event):
+        """Handle hide event.
+        
+        Args:
+            event: Hide event
+        """
+        super().hideEvent(event)
+        self._pause_animations()
+    
+    def _pause_animations(self):
+        """Stop all animation work while the bar cannot be seen."""
+        if self._indeterminate_animation.state() == QAbstractAnimation.State.Running:
+            self._indeterminate_animation.pause()
+        
+        # Skip any residual interpolation; the bar resumes at its real value
+        if (self._animation.state() != QAbstractAnimation.State.Stopped 
+                or self._pending_value is not None):
+            self._animation.stop()
+            self._value_timer.stop()
+            self._pending_value = None
+            self._animated_value = self._value
+    
+    def _resume_animations(self):
+        """Restart animation work once the bar is visible again."""
+        if not self._indeterminate or not self.isVisible():
+            return
+        
+        state = self._indeterminate_animation.state()
+        if state == QAbstractAnimation.State.Paused:
+            self._indeterminate_animation.resume()
+        elif state == QAbstractAnimation.State.Stopped:
+            self._indeterminate_animation.start()
+    
+    @Slot(Qt.ApplicationState)
+    def _on_application_state_changed(self, state: Qt.ApplicationState):
+        """Pause animations while the application is hidden or suspended.
+        
+        Args:
+            state: New application state
+        """
+        if state in (Qt.ApplicationState.ApplicationHidden, 
+                     Qt.ApplicationState.ApplicationSuspended):
+            self._pause_animations()
+        elif state == Qt.ApplicationState.ApplicationActive:
+            self._resume_animations()
+    
+    def resizeEvent(self, event):
+        """Handle resize event.
+        
+        Args:
+            event: Resize event
+        """
+        super().resizeEvent(event)
+        self._gradient_dirty = True
+    
+    def changeEvent(self, event):
+        """Handle change event.
+        
+        Args:
+            event: Change event
+        """
+        super().changeEvent(event)
+        if event.type() in (QEvent.Type.FontChange, QEvent.Type.StyleChange):
+            self._font_metrics = QFontMetrics(self.font())
+            self._cached_text_key = ()
+        elif event.type() == QEvent.Type.WindowStateChange:
+            if self.isMinimized():
+                self._pause_animations()
+            else:
+                self._resume_animations()
+    
     @Property(int)
     def animated_value(self) -> int:
         """Get the animated value property.
@@ -135,8 +257,60 @@ class EnhancedProgressBar(QWidget):
         # Emit signal
         self.progress_changed.emit(value)
         
-        # Animate to new value
+        # No point animating what nobody can see; the indeterminate
+        # renderer doesn't show the value either
+        if not self.isVisible() or self._indeterminate:
+            self._animation.stop()
+            self._value_timer.stop()
+            self._pending_value = None
+            self._animated_value = value
+            return
+        
+        # Sub-pixel moves don't restart the animation; the bar catches up once
+        # the accumulated change crosses a pixel (end points always animate)
+        if self._pending_value is not None:
+            target = self._pending_value
+        elif self._animation.state() == QAbstractAnimation.State.Running:
+            target = self._animation.endValue()
+        else:
+            target = self._animated_value
+        range_size = self._max_value - self._min_value
+        if range_size > 0 and value not in (self._min_value, self._max_value):
+            pixel_delta = ((value - target) / range_size) * max(self.width(), 1)
+            if abs(pixel_delta) < 1.0:
+                if self._text_visible:
+                    self.update()
+                return
+        
+        # Animate on the next frame with the latest value
+        self._pending_value = value
+        if not self._value_timer.isActive():
+            self._value_timer.start()
+    
+    @Slot()
+    def _apply_pending_value(self):
+        """Animate to the most recent value passed to setValue."""
+        value = self._pending_value
+        self._pending_value = None
+        if value is None:
+            return
+        
+        # Jump straight to tiny changes (under 1% of the range)
+        range_size = max(self._max_value - self._min_value, 1)
+        if abs(value - self._animated_value) < range_size * 0.01:
+            self._animation.stop()
+            self._animated_value = value
+            self.update()
+            return
+        
+        # Scale duration with the size of the move; short hops don't need
+        # the eased tail
+        frac = abs(value - self._animated_value) / range_size
         self._animation.stop()
+        self._animation.setDuration(int(max(80, min(500, 500 * frac * 4))))
+        self._animation.setEasingCurve(
+            QEasingCurve.Type.Linear if frac < 0.05 else QEasingCurve.Type.OutCubic
+        )
         self._animation.setStartValue(self._animated_value)
         self._animation.setEndValue(value)
         self._animation.start()
@@ -212,12 +386,13 @@ class EnhancedProgressBar(QWidget):
         self._indeterminate = indeterminate
         
         if indeterminate:
-            # Start animation timer
-            self._indeterminate_timer.start()
+            # Start animation; deferred to showEvent while hidden
+            if self.isVisible():
+                self._indeterminate_animation.start()
             self._animation.stop()
         else:
-            # Stop animation timer
-            self._indeterminate_timer.stop()
+            # Stop animation
+            self._indeterminate_animation.stop()
             # Reset to actual value
             self._animated_value = self._value
         
@@ -231,10 +406,17 @@ class EnhancedProgressBar(QWidget):
         """
         return self._indeterminate
     
-    def _update_indeterminate(self):
-        """Update the indeterminate animation state."""
-        self._indeterminate_position = (self._indeterminate_position + 2) % 300
-        self.update()
+    @Slot(object)
+    def _update_indeterminate(self, position: float):
+        """Update the indeterminate animation state.
+        
+        Args:
+            position: Sweep position between 0.0 and 1.0
+        """
+        self._indeterminate_position = position
+        
+        # Only the area inside the border changes
+        self.update(QRect(1, 1, self.width() - 2, self.height() - 2))
     
     def setTextVisible(self, visible: bool):
         """Set whether text is visible on the progress bar.
@@ -266,8 +448,25 @@ class EnhancedProgressBar(QWidget):
             return
             
         self._text_format = format_str
+        self._format_tokens = self._compile_format(format_str)
         self.update()
     
+    @staticmethod
+    def _compile_format(format_str: str) -> List[Tuple[str, Optional[str]]]:
+        """Split a %p/%v/%m format string into (literal, field) tokens.
+        
+        Args:
+            format_str: Format string (%p for percentage, %v for value, %m for maximum)
+            
+        Returns:
+            List of literal prefixes each followed by a field code ("p", "v",
+            "m"), with None as the field of the trailing literal
+        """
+        parts = _FORMAT_FIELD_RE.split(format_str)
+        tokens = [(parts[i], parts[i + 1]) for i in range(0, len(parts) - 1, 2)]
+        tokens.append((parts[-1], None))
+        return tokens
+    
     def format(self) -> str:
         """Get the text format string.
         
@@ -309,12 +508,11 @@ class EnhancedProgressBar(QWidget):
             
         self._progress_color = color
         
-        # Update gradient colors
+        # Gradient colors are derived from this color on the next paint
         if self._use_gradient:
-            h, s, v, a = color.getHsv()
-            self._gradient_color1 = QColor.fromHsv(h, s, v, a)
-            self._gradient_color2 = QColor.fromHsv(h, min(s + 20, 255), max(v - 30, 0), a)
+            self._gradient_overridden = False
         
+        self._gradient_dirty = True
         self.update()
     
     def setGradient(self, use_gradient: bool, color1: Optional[QColor] = None, color2: Optional[QColor] = None):
@@ -327,12 +525,19 @@ class EnhancedProgressBar(QWidget):
         """
         self._use_gradient = use_gradient
         
+        if color1 is not None or color2 is not None:
+            # Keep any derived color that isn't being replaced
+            if not self._gradient_overridden:
+                self._derive_gradient_colors()
+            self._gradient_overridden = True
+        
         if color1 is not None:
             self._gradient_color1 = color1
             
         if color2 is not None:
             self._gradient_color2 = color2
             
+        self._gradient_dirty = True
         self.update()
     
     def setBorderRadius(self, radius: int):
@@ -342,45 +547,109 @@ class EnhancedProgressBar(QWidget):
             radius: Border radius in pixels
         """
         self._border_radius = radius
+        self._gradient_dirty = True
         self.update()
     
+    def _derive_gradient_colors(self):
+        """Derive the gradient colors from the progress color."""
+        h, s, v, a = self._progress_color.getHsv()
+        self._gradient_color1 = QColor.fromHsv(h, s, v, a)
+        self._gradient_color2 = QColor.fromHsv(h, min(s + 20, 255), max(v - 30, 0), a)
+        self._gradient_overridden = True
+    
+    def _rebuild_paint_cache(self):
+        """Rebuild the cached pens, brushes and gradients."""
+        if not self._gradient_overridden:
+            self._derive_gradient_colors()
+        
+        self._border_pen = QPen(self._border_color)
+        self._background_brush = QBrush(self._background_color)
+        self._text_pen = QPen(self._text_color)
+        self._render_frame()
+        
+        if self._use_gradient:
+            gradient = QLinearGradient(0, 0, 0, self.height())
+            gradient.setColorAt(0, self._gradient_color1)
+            gradient.setColorAt(1, self._gradient_color2)
+            self._determinate_brush = QBrush(gradient)
+        else:
+            self._determinate_brush = QBrush(self._progress_color)
+        
+        # One widget-wide gradient; it is slid along by the brush transform
+        gradient = QLinearGradient(0, 0, self.width(), 0)
+        gradient.setColorAt(0, self._INDET_EDGE_COLOR)
+        gradient.setColorAt(0.4, self._progress_color)
+        gradient.setColorAt(0.6, self._progress_color)
+        gradient.setColorAt(1, self._INDET_EDGE_COLOR)
+        self._indeterminate_brush = QBrush(gradient)
+        
+        self._gradient_dirty = False
+    
+    def _render_frame(self):
+        """Render the static border and background into a cached pixmap."""
+        width = self.width()
+        height = self.height()
+        ratio = self.devicePixelRatioF()
+        
+        pixmap = QPixmap(max(1, int(width * ratio)), max(1, int(height * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setPen(self._border_pen)
+        painter.setBrush(self._background_brush)
+        if self._border_radius > 0:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.drawRoundedRect(0, 0, width - 1, height - 1, 
+                                   self._border_radius, self._border_radius)
+        else:
+            painter.drawRect(0, 0, width - 1, height - 1)
+        painter.end()
+        
+        self._frame_pixmap = pixmap
+    
     def paintEvent(self, event):
         """Handle paint event.
         
         Args:
             event: Paint event
         """
+        if event.region().isEmpty():
+            return
+        
+        if self._gradient_dirty:
+            self._rebuild_paint_cache()
+        
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Square corners can use the fast aliased integer rect path
+        rounded = self._border_radius > 0
+        if rounded:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Get widget dimensions
         width = self.width()
         height = self.height()
         
-        # Draw background
-        painter.setPen(QPen(self._border_color))
-        painter.setBrush(QBrush(self._background_color))
-        painter.drawRoundedRect(0, 0, width - 1, height - 1, 
-                               self._border_radius, self._border_radius)
+        # Draw background from the cached frame
+        painter.drawPixmap(0, 0, self._frame_pixmap)
         
         # Calculate progress width
         if self._indeterminate:
             # Draw pulsing/moving progress
-            gradient = QLinearGradient(0, 0, width, 0)
-            gradient.setColorAt(0, QColor(240, 240, 240))
-            gradient.setColorAt(0.4, self._progress_color)
-            gradient.setColorAt(0.6, self._progress_color)
-            gradient.setColorAt(1, QColor(240, 240, 240))
+            brush = self._indeterminate_brush
             
             # Shift gradient based on animation position
-            shift = self._indeterminate_position / 100.0 - 1
-            gradient.setStart(width * shift, 0)
-            gradient.setFinalStop(width * (shift + 1), 0)
+            shift = self._indeterminate_position * 3 - 1
+            brush.setTransform(QTransform.fromTranslate(width * shift, 0))
             
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QBrush(gradient))
-            painter.drawRoundedRect(1, 1, width - 2, height - 2, 
-                                  self._border_radius - 1, self._border_radius - 1)
+            painter.setPen(self._NO_PEN)
+            painter.setBrush(brush)
+            if rounded:
+                painter.drawRoundedRect(1, 1, width - 2, height - 2, 
+                                      self._border_radius - 1, self._border_radius - 1)
+            else:
+                painter.drawRect(1, 1, width - 2, height - 2)
         else:
             # Draw regular progress
             range_size = self._max_value - self._min_value
@@ -392,43 +661,51 @@ class EnhancedProgressBar(QWidget):
                     progress_width = 1
                     
                 if progress_width > 0:
-                    if self._use_gradient:
-                        # Create gradient
-                        gradient = QLinearGradient(0, 0, 0, height)
-                        gradient.setColorAt(0, self._gradient_color1)
-                        gradient.setColorAt(1, self._gradient_color2)
-                        painter.setBrush(QBrush(gradient))
+                    painter.setBrush(self._determinate_brush)
+                    painter.setPen(self._NO_PEN)
+                    if rounded:
+                        # Clip the full-width rounded fill instead of drawing a
+                        # narrower rounded rect, so the leading edge stays square
+                        painter.save()
+                        painter.setClipRect(1, 1, progress_width, height - 2)
+                        painter.drawRoundedRect(1, 1, width - 2, height - 2, 
+                                             self._border_radius - 1, self._border_radius - 1)
+                        painter.restore()
                     else:
-                        painter.setBrush(QBrush(self._progress_color))
-                    
-                    painter.setPen(Qt.PenStyle.NoPen)
-                    painter.drawRoundedRect(1, 1, progress_width, height - 2, 
-                                         self._border_radius - 1, self._border_radius - 1)
+                        painter.drawRect(1, 1, progress_width, height - 2)
         
         # Draw text if enabled
         if self._text_visible:
-            text = self._custom_text
-            if not text:
-                # Format text based on format string
-                percentage = 0
-                if self._max_value > self._min_value:
-                    percentage = int(((self._value - self._min_value) / 
-                                    (self._max_value - self._min_value)) * 100)
+            key = (self._value, self._min_value, self._max_value, 
+                   self._text_format, self._custom_text)
+            if key != self._cached_text_key:
+                text = self._custom_text
+                if not text:
+                    # Format text based on format string
+                    percentage = 0
+                    if self._max_value > self._min_value:
+                        percentage = int(((self._value - self._min_value) / 
+                                        (self._max_value - self._min_value)) * 100)
+                    
+                    if self._text_format == "%p%":
+                        text = f"{percentage}%"
+                    else:
+                        fields = {"p": percentage, "v": self._value, "m": self._max_value}
+                        text = "".join(
+                            literal + str(fields[code]) if code else literal
+                            for literal, code in self._format_tokens
+                        )
                 
-                text = self._text_format
-                text = text.replace("%p", str(percentage))
-                text = text.replace("%v", str(self._value))
-                text = text.replace("%m", str(self._max_value))
+                self._cached_text = text
+                self._cached_text_width = self._font_metrics.horizontalAdvance(text)
+                self._cached_text_key = key
             
-            painter.setPen(self._text_color)
+            painter.setPen(self._text_pen)
             painter.setFont(self.font())
             
             # Center text
-            metrics = QFontMetrics(self.font())
-            text_width = metrics.horizontalAdvance(text)
-            text_height = metrics.height()
-            
-            text_x = (width - text_width) // 2
-            text_y = (height + text_height) // 2 - metrics.descent()
+            metrics = self._font_metrics
+            text_x = (width - self._cached_text_width) // 2
+            text_y = (height + metrics.height()) // 2 - metrics.descent()
             
-            painter.drawText(text_x, text_y, text) 
\ No newline at end of file
+            painter.drawText(text_x, text_y, self._cached_text)
@@ -5,23 +5,81 @@ This component provides a visual representation of errors with details
 and suggestions for resolution.
 """
 
+import html
 import logging
+import re
 import traceback
 from typing import Dict, List, Optional, Union, Tuple
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QTextEdit, QFrame, QSizePolicy, QSpacerItem, QScrollArea
 )
-from PySide6.QtCore import Qt, Signal, Slot, QSize
-from PySide6.QtGui import (
-    QIcon, QPixmap, QColor, QPalette, QFont, QTextCursor, 
-    QTextCharFormat, QBrush
-)
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QObject, QRunnable, QThreadPool
+from PySide6.QtGui import QIcon, QPixmap, QPalette, QFont
 
 from .completion_animation import CrossAnimation
 
 logger = logging.getLogger(__name__)
 
+# Classifies a traceback line in one pass; error lines take precedence
+_LINE_RE = re.compile(r'(?P<error>.*(?:Error|Exception):)|(?P<path>  File |.*\.py)')
+
+
+def _format_details_html(details: str) -> str:
+    """Render error details as syntax-highlighted HTML.
+    
+    Args:
+        details: Error details text
+        
+    Returns:
+        HTML document for the details view
+    """
+    parts = []
+    for line in details.split('\n'):
+        escaped = html.escape(line)
+        # Apply different formatting based on line content
+        match = _LINE_RE.match(line)
+        if match is None:
+            parts.append(escaped)
+        elif match.lastgroup == "error":
+            parts.append(f'<span style="color:#d32f2f;font-weight:bold">{escaped}</span>')
+        else:
+            parts.append(f'<span style="color:#0d47a1">{escaped}</span>')
+    
+    return ('<pre style="font-family:Consolas,\'Courier New\',monospace;font-size:9pt;color:#333333">'
+            + '\n'.join(parts) + '</pre>')
+
+
+class _FormatSignals(QObject):
+    """Carries formatted details from a worker thread back to the GUI thread."""
+    
+    # Request id, plain details, details HTML
+    finished = Signal(int, str, str)
+
+
+class _FormatJob(QRunnable):
+    """Formats an exception traceback on the thread pool."""
+    
+    def __init__(self, request_id: int, ex: Exception, signals: _FormatSignals):
+        """Initialize the job.
+        
+        Args:
+            request_id: Id used to drop results for superseded errors
+            ex: Exception to format
+            signals: Parentless signals object owned by this job, so it
+                outlives the widget it reports to
+        """
+        super().__init__()
+        self._request_id = request_id
+        self._ex = ex
+        self._signals = signals
+    
+    def run(self):
+        """Format the traceback and post the result."""
+        details = "".join(traceback.format_exception(type(self._ex), self._ex, self._ex.__traceback__))
+        self._signals.finished.emit(self._request_id, details, _format_details_html(details))
+
+
 class ErrorVisualization(QWidget):
     """Widget for visualizing errors with details and suggestions."""
     
@@ -43,6 +101,15 @@ class ErrorVisualization(QWidget):
         self._error_details = ""
         self._suggestions = []
         
+        # Background traceback formatting
+        self._format_request = 0
+        
+        # Details, suggestions and the animation are built on first use
+        self._built = False
+        self.error_animation: Optional[CrossAnimation] = None
+        self.details_text: Optional[QTextEdit] = None
+        self.suggestions_layout: Optional[QVBoxLayout] = None
+        
         self._init_ui()
         
         logger.debug("Error visualization initialized")
@@ -53,13 +120,9 @@ class ErrorVisualization(QWidget):
         main_layout.setContentsMargins(20, 20, 20, 20)
         main_layout.setSpacing(15)
         
-        # Header with icon and title
+        # Header with icon and title; the icon is inserted by _ensure_built
         header_layout = QHBoxLayout()
-        
-        # Error icon/animation
-        self.error_animation = CrossAnimation()
-        self.error_animation.setFixedSize(48, 48)
-        header_layout.addWidget(self.error_animation, 0, Qt.AlignmentFlag.AlignTop)
+        self._header_layout = header_layout
         
         # Error title and message
         title_layout = QVBoxLayout()
@@ -87,19 +150,62 @@ class ErrorVisualization(QWidget):
         separator.setStyleSheet("background-color: #e0e0e0;")
         main_layout.addWidget(separator)
         
+        # Details and suggestions are added here by _ensure_built
+        self._body_layout = QVBoxLayout()
+        self._body_layout.setContentsMargins(0, 0, 0, 0)
+        self._body_layout.setSpacing(15)
+        main_layout.addLayout(self._body_layout)
+        
+        # Spacer to push buttons to the bottom
+        main_layout.addItem(QSpacerItem(20, 10, QSizePolicy.Policy.Minimum, 
+                                       QSizePolicy.Policy.Expanding))
+        
+        # Buttons
+        buttons_layout = QHBoxLayout()
+        
+        self.retry_button = QPushButton("Retry")
+        self.retry_button.clicked.connect(self._on_retry_clicked)
+        buttons_layout.addWidget(self.retry_button)
+        
+        buttons_layout.addStretch()
+        
+        self.close_button = QPushButton("Close")
+        self.close_button.clicked.connect(self._on_close_clicked)
+        buttons_layout.addWidget(self.close_button)
+        
+        main_layout.addLayout(buttons_layout)
+    
+    def _ensure_built(self):
+        """Build the animation, details and suggestions widgets on first use."""
+        if self._built:
+            return
+        self._built = True
+        
+        # Error icon/animation
+        self.error_animation = CrossAnimation()
+        self.error_animation.setFixedSize(48, 48)
+        self._header_layout.insertWidget(0, self.error_animation, 0, Qt.AlignmentFlag.AlignTop)
+        
+        body_layout = self._body_layout
+        
         # Error details (in a scroll area)
         details_group_label = QLabel("Error Details")
         details_group_label.setObjectName("details_group_label")
         font = details_group_label.font()
         font.setBold(True)
         details_group_label.setFont(font)
-        main_layout.addWidget(details_group_label)
+        body_layout.addWidget(details_group_label)
         
         self.details_text = QTextEdit()
         self.details_text.setReadOnly(True)
         self.details_text.setMinimumHeight(100)
+        
+        # Set a monospace font
+        font = QFont("Consolas, Courier New, monospace")
+        font.setPointSize(9)
+        self.details_text.setFont(font)
         self.details_text.setStyleSheet("background-color: #f5f5f5; border: 1px solid #e0e0e0;")
-        main_layout.addWidget(self.details_text)
+        body_layout.addWidget(self.details_text)
         
         # Suggestions
         suggestions_label = QLabel("Suggestions")
@@ -107,34 +213,50 @@ class ErrorVisualization(QWidget):
         font = suggestions_label.font()
         font.setBold(True)
         suggestions_label.setFont(font)
-        main_layout.addWidget(suggestions_label)
+        body_layout.addWidget(suggestions_label)
         
         # Suggestions are added dynamically
         self.suggestions_layout = QVBoxLayout()
-        main_layout.addLayout(self.suggestions_layout)
+        body_layout.addLayout(self.suggestions_layout)
         
-        # Spacer to push buttons to the bottom
-        main_layout.addItem(QSpacerItem(20, 10, QSizePolicy.Policy.Minimum, 
-                                       QSizePolicy.Policy.Expanding))
-        
-        # Buttons
-        buttons_layout = QHBoxLayout()
-        
-        self.retry_button = QPushButton("Retry")
-        self.retry_button.clicked.connect(self.retry_requested)
-        buttons_layout.addWidget(self.retry_button)
+        self._no_suggestions_label = QLabel("No specific suggestions available.")
+        self._no_suggestions_label.setStyleSheet("color: #757575;")
+        self._no_suggestions_label.hide()
+        self.suggestions_layout.addWidget(self._no_suggestions_label)
         
-        buttons_layout.addStretch()
-        
-        self.close_button = QPushButton("Close")
-        self.close_button.clicked.connect(self.close_requested)
-        buttons_layout.addWidget(self.close_button)
-        
-        main_layout.addLayout(buttons_layout)
+        # Pool of (row, text label) reused across set_error calls
+        self._suggestion_rows: List[Tuple[QWidget, QLabel]] = []
+    
+    def showEvent(self, event):
+        """Handle show event.
         
-        # Start error animation
+        Args:
+            event: Show event
+        """
+        super().showEvent(event)
+        self._ensure_built()
         self.error_animation.start()
     
+    def hideEvent(self, event):
+        """Handle hide event.
+        
+        Args:
+            event: Hide event
+        """
+        super().hideEvent(event)
+        if self.error_animation is not None:
+            self.error_animation.stop()
+    
+    @Slot()
+    def _on_retry_clicked(self):
+        """Handle retry button click."""
+        self.retry_requested.emit()
+    
+    @Slot()
+    def _on_close_clicked(self):
+        """Handle close button click."""
+        self.close_requested.emit()
+    
     def set_error(self, error_type: str, error_message: str, error_details: str = "",
                  suggestions: List[str] = None):
         """Set the error information.
@@ -150,6 +272,11 @@ class ErrorVisualization(QWidget):
         self._error_details = error_details
         self._suggestions = suggestions or []
         
+        # Any pending background formatting is now stale
+        self._format_request += 1
+        
+        self._ensure_built()
+        
         # Update UI
         self.error_type_label.setText(error_type)
         self.error_message_label.setText(error_message)
@@ -160,8 +287,9 @@ class ErrorVisualization(QWidget):
         # Update suggestions
         self._update_suggestions()
         
-        # Restart animation
-        self.error_animation.start()
+        # Restart animation; deferred to showEvent while hidden
+        if self.isVisible():
+            self.error_animation.start()
     
     def set_from_exception(self, ex: Exception, title: str = "Error"):
         """Set error from an exception.
@@ -173,12 +301,35 @@ class ErrorVisualization(QWidget):
         # Get exception details
         error_type = title or ex.__class__.__name__
         error_message = str(ex)
-        error_details = "".join(traceback.format_exception(type(ex), ex, ex.__traceback__))
         
         # Generate suggestions based on error type
         suggestions = self._generate_suggestions_for_exception(ex)
         
-        self.set_error(error_type, error_message, error_details, suggestions)
+        # Show the error right away; the traceback is formatted off the GUI thread
+        self.set_error(error_type, error_message, "", suggestions)
+        self.details_text.setPlainText("Formatting details...")
+        # Each job gets its own signals object; Qt drops the queued result
+        # if this widget is deleted before the job finishes
+        signals = _FormatSignals()
+        signals.finished.connect(self._on_details_formatted)
+        QThreadPool.globalInstance().start(
+            _FormatJob(self._format_request, ex, signals)
+        )
+    
+    @Slot(int, str, str)
+    def _on_details_formatted(self, request_id: int, details: str, details_html: str):
+        """Show traceback details formatted by a background job.
+        
+        Args:
+            request_id: Id of the formatting request
+            details: Plain error details
+            details_html: Highlighted details HTML
+        """
+        if request_id != self._format_request:
+            return
+        
+        self._error_details = details
+        self.details_text.setHtml(details_html)
     
     def _generate_suggestions_for_exception(self, ex: Exception) -> List[str]:
         """Generate suggestions based on exception type.
@@ -222,82 +373,64 @@ class ErrorVisualization(QWidget):
         """
         self.details_text.clear()
         
-        # Set a monospace font
-        font = QFont("Consolas, Courier New, monospace")
-        font.setPointSize(9)
-        self.details_text.setFont(font)
-        
         if not details:
             self.details_text.setPlainText("No additional details available.")
             return
         
-        cursor = QTextCursor(self.details_text.document())
-        
-        # Define text formats
-        normal_format = QTextCharFormat()
-        normal_format.setForeground(QBrush(QColor("#333333")))
-        
-        error_format = QTextCharFormat()
-        error_format.setForeground(QBrush(QColor("#d32f2f")))
-        error_format.setFontWeight(QFont.Weight.Bold)
+        # Build the whole document as HTML and set it in one call
+        self.details_text.setHtml(_format_details_html(details))
+    
+    def _update_suggestions(self):
+        """Update the suggestions list in the UI, reusing existing rows."""
+        # No suggestions
+        self._no_suggestions_label.setVisible(not self._suggestions)
         
-        path_format = QTextCharFormat()
-        path_format.setForeground(QBrush(QColor("#0d47a1")))
+        # Add rows only when the pool is too small
+        while len(self._suggestion_rows) < len(self._suggestions):
+            self._suggestion_rows.append(self._create_suggestion_row())
         
-        # Split lines and format
-        lines = details.split('\n')
-        for i, line in enumerate(lines):
-            # Apply different formatting based on line content
-            if "Error:" in line or "Exception:" in line:
-                cursor.insertText(line, error_format)
-            elif line.startswith("  File ") or ".py" in line:
-                cursor.insertText(line, path_format)
+        # Fill rows with a bullet point each and hide the rest
+        for i, (row, text) in enumerate(self._suggestion_rows):
+            if i < len(self._suggestions):
+                text.setText(self._suggestions[i])
+                row.setVisible(True)
             else:
-                cursor.insertText(line, normal_format)
-            
-            # Add newline (except for the last line)
-            if i < len(lines) - 1:
-                cursor.insertBlock()
+                row.setVisible(False)
     
-    def _update_suggestions(self):
-        """Update the suggestions list in the UI."""
-        # Clear existing suggestions
-        while self.suggestions_layout.count():
-            item = self.suggestions_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+    def _create_suggestion_row(self) -> Tuple[QWidget, QLabel]:
+        """Create a pooled suggestion row.
         
-        # No suggestions
-        if not self._suggestions:
-            no_suggestions = QLabel("No specific suggestions available.")
-            no_suggestions.setStyleSheet("color: #757575;")
-            self.suggestions_layout.addWidget(no_suggestions)
-            return
-        
-        # Add each suggestion with a bullet point
-        for suggestion in self._suggestions:
-            suggestion_layout = QHBoxLayout()
-            
-            # Bullet point
-            bullet = QLabel("•")
-            bullet.setStyleSheet("color: #2196F3; font-weight: bold;")
-            suggestion_layout.addWidget(bullet)
-            
-            # Suggestion text
-            text = QLabel(suggestion)
-            text.setWordWrap(True)
-            suggestion_layout.addWidget(text, 1)
-            
-            self.suggestions_layout.addLayout(suggestion_layout)
+        Returns:
+            Tuple of the row widget and its text label
+        """
+        row = QWidget()
+        suggestion_layout = QHBoxLayout(row)
+        suggestion_layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Bullet point
+        bullet = QLabel("•")
+        bullet.setStyleSheet("color: #2196F3; font-weight: bold;")
+        suggestion_layout.addWidget(bullet)
+        
+        # Suggestion text
+        text = QLabel()
+        text.setWordWrap(True)
+        suggestion_layout.addWidget(text, 1)
+        
+        self.suggestions_layout.addWidget(row)
+        return row, text
     
     def clear(self):
         """Clear all error information."""
         self.error_type_label.setText("Error")
         self.error_message_label.setText("")
+        
+        if not self._built:
+            return
+        
         self.details_text.clear()
         
-        # Clear suggestions
-        while self.suggestions_layout.count():
-            item = self.suggestions_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater() 
\ No newline at end of file
+        # Hide suggestions; the rows are kept for reuse
+        self._no_suggestions_label.hide()
+        for row, _ in self._suggestion_rows:
+            row.hide()
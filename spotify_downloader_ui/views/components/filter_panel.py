@@ -3,7 +3,9 @@ Filter Panel component for filtering track data.
 """
 
 import logging
-from typing import List, Dict, Optional, Any, Callable
+from collections import deque
+from functools import lru_cache, partial
+from typing import List, Dict, Optional, Any, Callable, Tuple
 from enum import Enum
 from datetime import datetime
 
@@ -13,14 +15,111 @@ from PySide6.QtWidgets import (
     QGroupBox, QGridLayout, QSizePolicy, QSlider,
     QToolButton, QMenu
 )
-from PySide6.QtCore import Qt, Signal, Slot, QSize, QDate
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QSize, QDate, QObject, QTimer, QSignalBlocker, QRegularExpression
+)
+from PySide6.QtGui import QIcon, QStandardItem, QStandardItemModel
 
 from spotify_downloader_ui.services.config_service import ConfigService
 from spotify_downloader_ui.services.error_service import ErrorService
 
 logger = logging.getLogger(__name__)
 
+# Delay before typed filter text is applied
+TEXT_DEBOUNCE_MS = 250
+
+# Number of recent searches kept and shown
+MAX_RECENT_SEARCHES = 5
+
+# Filter values applied by each built-in preset
+PRESETS: Dict[str, Dict[str, Any]] = {
+    "hidden_gems": {"gem_score": {"min": 70}, "popularity": {"max": 50}},
+    "recent": {"album.release_date": {"period": "90days"}},
+    "popular": {"popularity": {"min": 70}},
+}
+
+@lru_cache(maxsize=32)
+def _compile_text_filter(text: str) -> QRegularExpression:
+    """Compile filter text into a case-insensitive literal pattern.
+    
+    Args:
+        text: Filter text typed by the user
+        
+    Returns:
+        Optimized regular expression matching the text anywhere
+    """
+    regex = QRegularExpression(
+        QRegularExpression.escape(text),
+        QRegularExpression.PatternOption.CaseInsensitiveOption
+    )
+    regex.optimize()
+    return regex
+
+def _text_filter_value(text: str) -> Dict[str, Any]:
+    """Build the filter value for a text filter.
+    
+    Args:
+        text: Filter text
+        
+    Returns:
+        Dict with the raw ``text`` and its compiled ``re``
+    """
+    return {"text": text, "re": _compile_text_filter(text)}
+
+def _build_item_model(items: List[Tuple[str, str]], model: Optional[QStandardItemModel] = None) -> QStandardItemModel:
+    """Fill a combo box item model with (label, data) rows.
+    
+    Args:
+        items: Rows to add
+        model: Model to refill, or None to create one
+        
+    Returns:
+        The filled model
+    """
+    if model is None:
+        model = QStandardItemModel()
+    else:
+        model.clear()
+    
+    for label, data in items:
+        item = QStandardItem(label)
+        item.setData(data, Qt.ItemDataRole.UserRole)
+        model.appendRow(item)
+    return model
+
+class _Debouncer(QObject):
+    """Calls a function once its arguments have stopped changing."""
+    
+    def __init__(self, callback: Callable, timeout: int, parent: QObject):
+        """Initialize the debouncer.
+        
+        Args:
+            callback: Function to call with the latest arguments
+            timeout: Quiet period in milliseconds
+            parent: Owner of the debouncer
+        """
+        super().__init__(parent)
+        self._callback = callback
+        self._args = ()
+        
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(timeout)
+        self._timer.timeout.connect(self._fire)
+    
+    def __call__(self, *args):
+        """Record the latest arguments and restart the quiet period."""
+        self._args = args
+        self._timer.start()
+    
+    def cancel(self):
+        """Drop a pending call."""
+        self._timer.stop()
+    
+    def _fire(self):
+        """Call the callback with the latest arguments."""
+        self._callback(*self._args)
+
 class FilterType(Enum):
     """Types of filters."""
     TEXT = 0
@@ -34,6 +133,16 @@ class FilterOperation(Enum):
     AND = 0
     OR = 1
 
+# Default (selectivity, relative cost) per filter type. Selectivity is the
+# expected fraction of tracks that pass; cost is per-track evaluation effort.
+_TYPE_HINTS = {
+    FilterType.TEXT: (0.3, 5.0),
+    FilterType.RANGE: (0.5, 1.0),
+    FilterType.DATE: (0.4, 3.0),
+    FilterType.CATEGORY: (0.1, 2.0),
+    FilterType.BOOLEAN: (0.5, 0.5),
+}
+
 class FilterCriteria:
     """Represents a filter criteria."""
     
@@ -41,7 +150,9 @@ class FilterCriteria:
                  field: str, 
                  display_name: str,
                  filter_type: FilterType,
-                 options: Dict[str, Any] = None):
+                 options: Dict[str, Any] = None,
+                 selectivity_hint: Optional[float] = None,
+                 cost_hint: Optional[float] = None):
         """Initialize filter criteria.
         
         Args:
@@ -49,17 +160,54 @@ class FilterCriteria:
             display_name: Human-readable name for the filter
             filter_type: Type of filter
             options: Additional options for the filter
+            selectivity_hint: Expected fraction of tracks passing the filter
+            cost_hint: Relative cost of evaluating the filter per track
         """
         self.field = field
         self.display_name = display_name
         self.filter_type = filter_type
         self.options = options or {}
         self.is_active = False
+        
+        # Range bounds, resolved once instead of on every widget build
+        if filter_type == FilterType.RANGE:
+            self.min = self.options.get("min", 0)
+            self.max = self.options.get("max", 100)
+            self.span = self.max - self.min
+        
+        default_selectivity, default_cost = _TYPE_HINTS[filter_type]
+        self.selectivity_hint = default_selectivity if selectivity_hint is None else selectivity_hint
+        self.cost_hint = default_cost if cost_hint is None else cost_hint
+        # Ascending rank is the cheapest order for AND evaluation
+        self.rank = self.cost_hint / max(1.0 - self.selectivity_hint, 1e-6)
+        # Bit position in the panel's active-filter mask
+        self.index = -1
 
 class FilterPanel(QWidget):
     """Widget for filtering track data."""
     
-    filter_changed = Signal(dict)  # Emits filter criteria when changed
+    filter_changed = Signal(object)  # Emits filter criteria dict when changed
+    # Emits (active mask, per-criteria values, operation) when changed
+    filter_mask_changed = Signal(int, object, int)
+    
+    # Placeholder strings shared by every panel, keyed by display name
+    _PLACEHOLDER_CACHE: Dict[str, str] = {}
+    
+    # Combo box rows; the models are built once and shared by all combos
+    _CATEGORY_DEFAULT_ITEMS = [
+        ("All", ""),
+        ("Option 1", "option1"),
+        ("Option 2", "option2"),
+        ("Option 3", "option3"),
+    ]
+    _DATE_ITEMS = [
+        ("Any time", ""),
+        ("Last 30 days", "30days"),
+        ("Last 90 days", "90days"),
+        ("Last year", "1year"),
+        ("Custom range", "custom"),
+    ]
+    _SHARED_MODELS: Dict[str, QStandardItemModel] = {}
     
     def __init__(self, config_service: ConfigService, error_service: ErrorService):
         """Initialize the filter panel.
@@ -75,9 +223,25 @@ class FilterPanel(QWidget):
         
         # Filter state
         self.criteria = []
+        self._criteria_by_field: Dict[str, FilterCriteria] = {}
+        self._filter_groups: List[QGroupBox] = []
+        # Category combos and their per-field option models
+        self._category_combos: Dict[str, QComboBox] = {}
+        self._category_models: Dict[str, QStandardItemModel] = {}
+        # Field/type layout the filter widgets were last built for
+        self._filters_signature: Optional[tuple] = None
         self.active_filters = {}
+        # One bit per criteria index, with values kept alongside
+        self._active_mask = 0
+        self._values: List[Any] = []
+        self._last_emitted: Optional[Dict[str, Any]] = None
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(0)
+        self._emit_timer.timeout.connect(self._flush_emit)
         self.filter_operation = FilterOperation.AND
-        self.recent_searches = []
+        self.recent_searches = deque(maxlen=MAX_RECENT_SEARCHES)
+        self._recent_set = set()
         
         self._init_ui()
         self._create_default_criteria()
@@ -113,6 +277,8 @@ class FilterPanel(QWidget):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search tracks...")
         self.search_input.returnPressed.connect(self._on_search)
+        self._search_debouncer = _Debouncer(self._on_search_text_changed, TEXT_DEBOUNCE_MS, self)
+        self.search_input.textChanged.connect(self._search_debouncer)
         search_layout.addWidget(self.search_input)
         
         main_layout.addLayout(search_layout)
@@ -130,6 +296,15 @@ class FilterPanel(QWidget):
         self.no_recent_label = QLabel("No recent searches")
         recent_layout.addWidget(self.no_recent_label)
         
+        # Fixed pool of buttons, relabelled as searches are added
+        self._recent_buttons = []
+        for index in range(MAX_RECENT_SEARCHES):
+            button = QPushButton()
+            button.setVisible(False)
+            button.clicked.connect(partial(self._on_recent_button_clicked, index))
+            recent_layout.addWidget(button)
+            self._recent_buttons.append(button)
+        
         main_layout.addWidget(self.recent_group)
         
         # Filters container
@@ -209,125 +384,173 @@ class FilterPanel(QWidget):
                 filter_type=FilterType.BOOLEAN
             )
         ]
+        for index, criteria in enumerate(self.criteria):
+            criteria.index = index
+        self._criteria_by_field = {c.field: c for c in self.criteria}
+        self._active_mask = 0
+        self._values = [None] * len(self.criteria)
         
         # Create filter widgets
         self._create_filter_widgets()
     
     def _create_filter_widgets(self):
         """Create filter widgets based on criteria."""
-        # Clear existing widgets
-        for i in reversed(range(self.filters_layout.count())):
-            widget = self.filters_layout.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
+        # Nothing to do if the criteria layout hasn't changed
+        signature = tuple((c.field, c.filter_type) for c in self.criteria)
+        if signature == self._filters_signature:
+            return
+        
+        # Clear existing widgets (and the trailing stretch) on a rebuild
+        if self._filters_signature is not None:
+            while self.filters_layout.count():
+                widget = self.filters_layout.takeAt(0).widget()
+                if widget:
+                    widget.deleteLater()
+        self._filters_signature = signature
+        self._filter_groups = []
+        self._category_combos = {}
         
         # Create new widgets
         for criteria in self.criteria:
             group = QGroupBox(criteria.display_name)
             group.setCheckable(True)
             group.setChecked(False)
-            group_layout = QVBoxLayout(group)
             
-            # Create controls based on filter type
-            if criteria.filter_type == FilterType.TEXT:
-                # Text search field
-                text_input = QLineEdit()
-                text_input.setPlaceholderText(f"Search {criteria.display_name.lower()}...")
-                text_input.textChanged.connect(
-                    lambda text, field=criteria.field: self._on_text_filter_changed(field, text)
-                )
-                group_layout.addWidget(text_input)
-                
-            elif criteria.filter_type == FilterType.RANGE:
-                # Range slider with labels
-                range_layout = QHBoxLayout()
-                
-                min_value = criteria.options.get("min", 0)
-                max_value = criteria.options.get("max", 100)
-                
-                # Min label
-                min_label = QLabel(str(min_value))
-                range_layout.addWidget(min_label)
-                
-                # Slider
-                slider = QSlider(Qt.Orientation.Horizontal)
-                slider.setMinimum(min_value)
-                slider.setMaximum(max_value)
-                slider.setValue(min_value)
-                slider.setTickPosition(QSlider.TickPosition.TicksBelow)
-                slider.setTickInterval((max_value - min_value) // 5)
-                slider.valueChanged.connect(
-                    lambda value, field=criteria.field, label=min_label: 
-                    self._on_range_filter_changed(field, value, label)
-                )
-                range_layout.addWidget(slider, 1)
-                
-                # Max label
-                max_label = QLabel(str(max_value))
-                range_layout.addWidget(max_label)
-                
-                group_layout.addLayout(range_layout)
-                
-            elif criteria.filter_type == FilterType.CATEGORY:
-                # Combo box with categories
-                # In a real implementation, these would be populated from the data
-                combo = QComboBox()
-                combo.addItem("All", "")
-                combo.addItem("Option 1", "option1")
-                combo.addItem("Option 2", "option2")
-                combo.addItem("Option 3", "option3")
-                combo.currentIndexChanged.connect(
-                    lambda index, field=criteria.field, combo=combo: 
-                    self._on_category_filter_changed(field, combo.currentData())
-                )
-                group_layout.addWidget(combo)
-            
-            elif criteria.filter_type == FilterType.DATE:
-                # Date filter controls
-                # This is simplified - a real implementation would use a date picker
-                combo = QComboBox()
-                combo.addItem("Any time", "")
-                combo.addItem("Last 30 days", "30days")
-                combo.addItem("Last 90 days", "90days")
-                combo.addItem("Last year", "1year")
-                combo.addItem("Custom range", "custom")
-                combo.currentIndexChanged.connect(
-                    lambda index, field=criteria.field, combo=combo: 
-                    self._on_date_filter_changed(field, combo.currentData())
-                )
-                group_layout.addWidget(combo)
-                
-            elif criteria.filter_type == FilterType.BOOLEAN:
-                # Boolean checkboxes
-                check_layout = QHBoxLayout()
-                
-                yes_check = QCheckBox("Yes")
-                yes_check.stateChanged.connect(
-                    lambda state, field=criteria.field, value=True: 
-                    self._on_boolean_filter_changed(field, value, state)
-                )
-                check_layout.addWidget(yes_check)
-                
-                no_check = QCheckBox("No")
-                no_check.stateChanged.connect(
-                    lambda state, field=criteria.field, value=False: 
-                    self._on_boolean_filter_changed(field, value, state)
-                )
-                check_layout.addWidget(no_check)
-                
-                check_layout.addStretch()
-                group_layout.addLayout(check_layout)
+            # Controls are built the first time the filter is enabled
+            group.toggled.connect(partial(self._build_filter_body, criteria, group))
             
             # Connect checkbox state of the group itself
-            group.toggled.connect(
-                lambda state, field=criteria.field: self._on_filter_toggled(field, state)
-            )
+            group.toggled.connect(partial(self._on_filter_toggled, criteria.field))
             
             self.filters_layout.addWidget(group)
+            self._filter_groups.append(group)
         
         # Add stretch at the end
         self.filters_layout.addStretch(1)
     
+    @classmethod
+    def _shared_model(cls, name: str, items: List[Tuple[str, str]]) -> QStandardItemModel:
+        """Get a combo box model shared across all panels.
+        
+        Args:
+            name: Cache key for the model
+            items: Rows to build the model from on first use
+            
+        Returns:
+            Shared item model
+        """
+        model = cls._SHARED_MODELS.get(name)
+        if model is None:
+            model = cls._SHARED_MODELS[name] = _build_item_model(items)
+        return model
+    
+    @classmethod
+    def _placeholder(cls, name: str) -> str:
+        """Get the placeholder text for a text filter.
+        
+        Args:
+            name: Display name of the filter
+            
+        Returns:
+            Placeholder text
+        """
+        placeholder = cls._PLACEHOLDER_CACHE.get(name)
+        if placeholder is None:
+            placeholder = cls._PLACEHOLDER_CACHE[name] = f"Search {name.lower()}..."
+        return placeholder
+    
+    def _build_filter_body(self, criteria: FilterCriteria, group: QGroupBox, enabled: bool = True):
+        """Create the controls of a filter group.
+        
+        Args:
+            criteria: Filter criteria the group represents
+            group: Group box to fill
+            enabled: Whether the group was just enabled
+        """
+        if not enabled or group.property("_built"):
+            return
+        group.setProperty("_built", True)
+        
+        group_layout = QVBoxLayout(group)
+        
+        # Create controls based on filter type
+        if criteria.filter_type == FilterType.TEXT:
+            # Text search field
+            text_input = QLineEdit()
+            text_input.setPlaceholderText(self._placeholder(criteria.display_name))
+            text_input.textChanged.connect(_Debouncer(
+                partial(self._on_text_filter_changed, criteria.field),
+                TEXT_DEBOUNCE_MS, text_input
+            ))
+            group_layout.addWidget(text_input)
+            
+        elif criteria.filter_type == FilterType.RANGE:
+            # Range slider with labels
+            range_layout = QHBoxLayout()
+            
+            min_value = criteria.min
+            max_value = criteria.max
+            
+            # Min label
+            min_label = QLabel(str(min_value))
+            min_label.setObjectName("range_value_label")
+            range_layout.addWidget(min_label)
+            
+            # Slider
+            slider = QSlider(Qt.Orientation.Horizontal)
+            slider.setMinimum(min_value)
+            slider.setMaximum(max_value)
+            slider.setValue(min_value)
+            # The label follows the drag; the filter is applied on release
+            slider.valueChanged.connect(min_label.setNum)
+            slider.valueChanged.connect(
+                partial(self._on_range_filter_changed, criteria.field, slider)
+            )
+            slider.sliderReleased.connect(
+                partial(self._on_range_slider_released, criteria.field, slider)
+            )
+            range_layout.addWidget(slider, 1)
+            
+            # Max label
+            max_label = QLabel(str(max_value))
+            range_layout.addWidget(max_label)
+            
+            group_layout.addLayout(range_layout)
+            
+        elif criteria.filter_type == FilterType.CATEGORY:
+            # Combo box with categories
+            # Placeholder options until set_available_categories supplies real ones
+            combo = QComboBox()
+            model = self._category_models.get(criteria.field)
+            if model is None:
+                model = self._shared_model("category", self._CATEGORY_DEFAULT_ITEMS)
+            combo.setModel(model)
+            self._category_combos[criteria.field] = combo
+            combo.currentIndexChanged.connect(
+                partial(self._on_category_filter_changed, criteria.field, combo)
+            )
+            group_layout.addWidget(combo)
+        
+        elif criteria.filter_type == FilterType.DATE:
+            # Date filter controls
+            # This is simplified - a real implementation would use a date picker
+            combo = QComboBox()
+            combo.setModel(self._shared_model("date", self._DATE_ITEMS))
+            combo.currentIndexChanged.connect(
+                partial(self._on_date_filter_changed, criteria.field, combo)
+            )
+            group_layout.addWidget(combo)
+            
+        elif criteria.filter_type == FilterType.BOOLEAN:
+            # Tri-state checkbox: unset, only Yes, only No
+            check = QCheckBox(criteria.display_name)
+            check.setTristate(True)
+            check.setToolTip("Checked: only yes\nPartially checked: only no\nUnchecked: any")
+            check.stateChanged.connect(
+                partial(self._on_boolean_filter_changed, criteria.field)
+            )
+            group_layout.addWidget(check)
+    
     def set_available_categories(self, field: str, categories: List[str]):
         """Set available categories for a category filter.
         
@@ -335,9 +558,24 @@ class FilterPanel(QWidget):
             field: Filter field name
             categories: List of available category values
         """
-        # Find the relevant filter widget and update its options
-        # This is a simplified implementation - would need more in a real app
-        logger.info(f"Would update categories for {field}: {categories}")
+        criteria = self._criteria_by_field.get(field)
+        if criteria is None or criteria.filter_type != FilterType.CATEGORY:
+            logger.warning(f"No category filter for field: {field}")
+            return
+        
+        # Each field gets its own model, created once and refilled after that
+        items = [("All", "")] + [(category, category) for category in categories]
+        model = self._category_models.get(field)
+        if model is None:
+            model = self._category_models[field] = _build_item_model(items)
+            model.setParent(self)
+        else:
+            _build_item_model(items, model)
+        
+        # Attach it if the filter controls have been built already
+        combo = self._category_combos.get(field)
+        if combo is not None and combo.model() is not model:
+            combo.setModel(model)
     
     def apply_preset(self, preset_name: str):
         """Apply a saved filter preset.
@@ -345,33 +583,72 @@ class FilterPanel(QWidget):
         Args:
             preset_name: Name of the preset to apply
         """
-        # In a real implementation, this would load preset values
-        # For now, just log it
-        logger.info(f"Would apply preset: {preset_name}")
+        preset = PRESETS.get(preset_name)
+        if preset is None:
+            logger.warning(f"Unknown filter preset: {preset_name}")
+            return
         
-        # Simulate loading a preset
-        self.clear_filters()
+        logger.info(f"Applying preset: {preset_name}")
         
-        if preset_name == "hidden_gems":
-            # Set up filters for hidden gems
-            self._update_filter("gem_score", {"min": 70})
-            self._update_filter("popularity", {"max": 50})
-        elif preset_name == "recent":
-            # Set up filters for recent additions
-            self._update_filter("album.release_date", {"period": "90days"})
-        elif preset_name == "popular":
-            # Set up filters for popular tracks
-            self._update_filter("popularity", {"min": 70})
+        # Replace the filters and notify once
+        self._reset_filters()
+        for field, value in preset.items():
+            # Copy so the shared preset definitions can't be mutated
+            self._update_filter(field, dict(value), emit=False)
+        self._schedule_emit()
     
     def clear_filters(self):
         """Clear all active filters."""
-        self.active_filters = {}
-        
-        # Reset UI - would uncheck all filter groups
+        self._reset_filters()
         logger.info("Cleared all filters")
         
         # Notify of change
-        self.filter_changed.emit({})
+        self._schedule_emit()
+    
+    def _reset_filters(self):
+        """Reset the filter state and controls without notifying."""
+        self.active_filters = {}
+        self._active_mask = 0
+        self._values = [None] * len(self.criteria)
+        
+        # Reset UI without each control reporting its own change
+        for group in self._filter_groups:
+            with QSignalBlocker(group):
+                group.setChecked(False)
+            if group.property("_built"):
+                self._reset_filter_controls(group)
+        for criteria in self.criteria:
+            criteria.is_active = False
+        self._search_debouncer.cancel()
+        with QSignalBlocker(self.search_input):
+            self.search_input.clear()
+    
+    def _reset_filter_controls(self, group: QGroupBox):
+        """Return the controls of a filter group to their defaults without notifying.
+        
+        Args:
+            group: Filter group whose controls were built
+        """
+        for text_input in group.findChildren(QLineEdit):
+            # Drop a change still waiting out its debounce
+            for debouncer in text_input.findChildren(_Debouncer):
+                debouncer.cancel()
+            with QSignalBlocker(text_input):
+                text_input.clear()
+        
+        for slider in group.findChildren(QSlider):
+            with QSignalBlocker(slider):
+                slider.setValue(slider.minimum())
+            # The value label normally follows the slider's signal
+            group.findChild(QLabel, "range_value_label").setNum(slider.minimum())
+        
+        for combo in group.findChildren(QComboBox):
+            with QSignalBlocker(combo):
+                combo.setCurrentIndex(0)
+        
+        for check in group.findChildren(QCheckBox):
+            with QSignalBlocker(check):
+                check.setCheckState(Qt.CheckState.Unchecked)
     
     def add_recent_search(self, search_text: str):
         """Add a search term to recent searches.
@@ -379,47 +656,51 @@ class FilterPanel(QWidget):
         Args:
             search_text: Search text to add
         """
-        if not search_text or search_text in self.recent_searches:
+        if not search_text or search_text in self._recent_set:
             return
             
-        # Add to recent searches (limit to 5)
-        self.recent_searches.insert(0, search_text)
-        if len(self.recent_searches) > 5:
-            self.recent_searches.pop()
+        # Add to recent searches; the deque drops the oldest past its limit
+        if len(self.recent_searches) == self.recent_searches.maxlen:
+            self._recent_set.discard(self.recent_searches[-1])
+        self.recent_searches.appendleft(search_text)
+        self._recent_set.add(search_text)
         
         # Update UI
         self._update_recent_searches()
     
     def _update_recent_searches(self):
         """Update the recent searches UI."""
-        # Clear existing items
-        for i in reversed(range(self.recent_layout.count())):
-            widget = self.recent_layout.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
-        
-        if not self.recent_searches:
-            self.recent_layout.addWidget(self.no_recent_label)
-            return
-            
-        # Add recent search buttons
-        for search in self.recent_searches:
-            button = QPushButton(search)
-            button.clicked.connect(lambda _, text=search: self._on_recent_search_clicked(text))
-            self.recent_layout.addWidget(button)
+        self.no_recent_label.setVisible(not self.recent_searches)
+        
+        # Relabel the pooled buttons and hide the unused ones
+        for index, button in enumerate(self._recent_buttons):
+            if index < len(self.recent_searches):
+                button.setText(self.recent_searches[index])
+                button.setVisible(True)
+            else:
+                button.setVisible(False)
     
-    def _update_filter(self, field: str, value: Any):
+    def _update_filter(self, field: str, value: Any, emit: bool = True):
         """Update a filter value.
         
         Args:
             field: Filter field name
             value: New filter value
+            emit: Whether to schedule a change notification
         """
+        if field in self.active_filters and self.active_filters[field] == value:
+            return
+        
         # Update the active filters
         self.active_filters[field] = value
+        criteria = self._criteria_by_field.get(field)
+        if criteria:
+            self._active_mask |= 1 << criteria.index
+            self._values[criteria.index] = value
         
         # Notify of change
-        self.filter_changed.emit(self.active_filters)
+        if emit:
+            self._schedule_emit()
     
     def _remove_filter(self, field: str):
         """Remove a filter.
@@ -429,9 +710,60 @@ class FilterPanel(QWidget):
         """
         if field in self.active_filters:
             del self.active_filters[field]
+            criteria = self._criteria_by_field.get(field)
+            if criteria:
+                self._active_mask &= ~(1 << criteria.index)
+                self._values[criteria.index] = None
             
             # Notify of change
-            self.filter_changed.emit(self.active_filters)
+            self._schedule_emit()
+    
+    def _schedule_emit(self):
+        """Emit the active filters on the next event loop pass.
+        
+        Changes made in the same pass are coalesced into one emission.
+        """
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
+    
+    @Slot()
+    def _flush_emit(self):
+        """Emit the active filters if they differ from the last emission."""
+        if self.active_filters == self._last_emitted:
+            return
+        
+        # Let downstream AND evaluation reject tracks with the cheapest
+        # and most selective filters first
+        if self.filter_operation == FilterOperation.AND:
+            self.active_filters = dict(sorted(
+                self.active_filters.items(), key=self._evaluation_rank
+            ))
+        
+        self._last_emitted = dict(self.active_filters)
+        self.filter_changed.emit(self._last_emitted)
+        self.filter_mask_changed.emit(
+            self._active_mask, tuple(self._values), self.filter_operation.value
+        )
+    
+    def _evaluation_rank(self, item: tuple) -> float:
+        """Get the AND evaluation rank of an active filter.
+        
+        Args:
+            item: (field, value) pair from the active filters
+            
+        Returns:
+            Rank; non-criteria entries such as the operation come first
+        """
+        criteria = self._criteria_by_field.get(item[0])
+        return criteria.rank if criteria else -1.0
+    
+    def active_mask(self) -> int:
+        """Get the active filters as a bitmask.
+        
+        Returns:
+            Mask with bit ``criteria.index`` set for each active filter
+        """
+        return self._active_mask
     
     @Slot(int)
     def _on_operation_changed(self, index: int):
@@ -460,7 +792,19 @@ class FilterPanel(QWidget):
             self.add_recent_search(search_text)
             
             # Update filter
-            self._update_filter("search", search_text)
+            self._update_filter("search", _text_filter_value(search_text))
+    
+    @Slot(str)
+    def _on_search_text_changed(self, search_text: str):
+        """Handle search text once typing has paused.
+        
+        Args:
+            search_text: Current search text
+        """
+        if search_text:
+            self._update_filter("search", _text_filter_value(search_text))
+        else:
+            self._remove_filter("search")
     
     @Slot(bool)
     def _on_recent_toggled(self, checked: bool):
@@ -472,6 +816,17 @@ class FilterPanel(QWidget):
         # This would show/hide the recent searches in a real implementation
         pass
     
+    @Slot(int, bool)
+    def _on_recent_button_clicked(self, index: int, checked: bool = False):
+        """Handle click on a pooled recent search button.
+        
+        Args:
+            index: Position of the button in the pool
+            checked: Button checked state (unused)
+        """
+        if index < len(self.recent_searches):
+            self._on_recent_search_clicked(self.recent_searches[index])
+    
     @Slot(str)
     def _on_recent_search_clicked(self, search_text: str):
         """Handle click on a recent search.
@@ -483,7 +838,7 @@ class FilterPanel(QWidget):
         self.search_input.setText(search_text)
         
         # Apply the search
-        self._update_filter("search", search_text)
+        self._update_filter("search", _text_filter_value(search_text))
     
     @Slot(str, str)
     def _on_text_filter_changed(self, field: str, text: str):
@@ -494,65 +849,75 @@ class FilterPanel(QWidget):
             text: Filter text
         """
         if text:
-            self._update_filter(field, text)
+            self._update_filter(field, _text_filter_value(text))
         else:
             self._remove_filter(field)
     
-    @Slot(str, int, QLabel)
-    def _on_range_filter_changed(self, field: str, value: int, label: QLabel):
+    def _on_range_filter_changed(self, field: str, slider: QSlider, value: int):
         """Handle range filter change.
         
         Args:
             field: Filter field
+            slider: Slider that changed
             value: Filter value
-            label: Label to update
         """
-        # Update label
-        label.setText(str(value))
+        # Mid-drag values are only shown; the release applies the final one
+        if slider.isSliderDown():
+            return
         
         # Update filter
         self._update_filter(field, {"min": value})
     
-    @Slot(str, str)
-    def _on_category_filter_changed(self, field: str, category: str):
+    def _on_range_slider_released(self, field: str, slider: QSlider):
+        """Apply a range filter once its slider is released.
+        
+        Args:
+            field: Filter field
+            slider: Released slider
+        """
+        self._update_filter(field, {"min": slider.value()})
+    
+    def _on_category_filter_changed(self, field: str, combo: QComboBox, index: int):
         """Handle category filter change.
         
         Args:
             field: Filter field
-            category: Selected category
+            combo: Category combo box
+            index: Selected index
         """
+        category = combo.itemData(index)
         if category:
             self._update_filter(field, category)
         else:
             self._remove_filter(field)
     
-    @Slot(str, str)
-    def _on_date_filter_changed(self, field: str, period: str):
+    def _on_date_filter_changed(self, field: str, combo: QComboBox, index: int):
         """Handle date filter change.
         
         Args:
             field: Filter field
-            period: Selected time period
+            combo: Time period combo box
+            index: Selected index
         """
+        period = combo.itemData(index)
         if period:
             self._update_filter(field, {"period": period})
         else:
             self._remove_filter(field)
     
-    @Slot(str, bool, int)
-    def _on_boolean_filter_changed(self, field: str, value: bool, state: int):
+    @Slot(str, int)
+    def _on_boolean_filter_changed(self, field: str, state: int):
         """Handle boolean filter change.
         
         Args:
             field: Filter field
-            value: Boolean value
-            state: Checkbox state
+            state: Tri-state checkbox state
         """
         if state == Qt.CheckState.Checked.value:
-            self._update_filter(field, value)
+            self._update_filter(field, True)
+        elif state == Qt.CheckState.PartiallyChecked.value:
+            self._update_filter(field, False)
         else:
-            # Only remove if both checkboxes are unchecked
-            # This is simplified - a real implementation would be more complex
             self._remove_filter(field)
     
     @Slot(str, bool)
@@ -564,10 +929,9 @@ class FilterPanel(QWidget):
             enabled: Whether the filter is enabled
         """
         # Update filter criteria active state
-        for criteria in self.criteria:
-            if criteria.field == field:
-                criteria.is_active = enabled
-                break
+        criteria = self._criteria_by_field.get(field)
+        if criteria:
+            criteria.is_active = enabled
         
         if not enabled:
             self._remove_filter(field)
@@ -626,6 +990,15 @@ class FilterSidebar:
         """
         return self.filter_panel.filter_changed
     
+    @property
+    def filter_mask_changed(self) -> Signal:
+        """Get the filter mask changed signal.
+        
+        Returns:
+            Signal that emits the active filter bitmask when filters change
+        """
+        return self.filter_panel.filter_mask_changed
+    
     def clear_filters(self):
         """Clear all active filters."""
         self.filter_panel.clear_filters()
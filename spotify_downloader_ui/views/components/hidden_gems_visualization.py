@@ -3,26 +3,95 @@ Hidden Gems Visualization component for displaying and interacting with hidden g
 """
 
 import logging
-from typing import List, Dict, Optional, Any, Callable
+from typing import List, Dict, Optional, Any, Callable, Tuple
 from enum import Enum
+from functools import partial
 import math
 
+import numpy as np
+
+try:
+    from fast_histogram import histogram1d
+except ImportError:
+    histogram1d = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QScrollArea, QFrame, QTabWidget, QToolBar, QToolButton,
     QSplitter, QMenu, QSlider, QCheckBox,
     QGroupBox, QGridLayout, QSizePolicy, QComboBox
 )
-from PySide6.QtCore import Qt, Signal, Slot, QSize, QRectF
-from PySide6.QtGui import QIcon, QPixmap, QImage, QPainter, QColor, QPen, QBrush, QLinearGradient, QPainterPath, QFont, QAction, QAction, QAction
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QRectF, QPointF, QTimer, QEvent
+from PySide6.QtGui import QIcon, QPixmap, QImage, QPainter, QColor, QPen, QBrush, QLinearGradient, QPolygonF, QFont, QPalette, QAction, QAction, QAction
 
-from PySide6.QtCharts import QChart, QChartView, QLineSeries, QBarSeries, QBarSet, QBarCategoryAxis, QValueAxis, QPieSeries
+from PySide6.QtCharts import QChart, QChartView, QPieSeries
 
 from spotify_downloader_ui.services.config_service import ConfigService
 from spotify_downloader_ui.services.error_service import ErrorService
 
 logger = logging.getLogger(__name__)
 
+# Score histogram layout: uniform bins of width 10 over 0-100
+HISTOGRAM_BINS = 10
+_BIN_LABELS = tuple(f"{i*10}-{(i+1)*10-1}" for i in range(HISTOGRAM_BINS))
+# Threshold line x-coordinate (center of the threshold's bin) per threshold
+_THRESHOLD_X = tuple(min(v // 10, HISTOGRAM_BINS - 1) + 0.5 for v in range(101))
+
+def _score_histogram(scores: np.ndarray) -> List[int]:
+    """Count scores per histogram bin.
+    
+    Scores outside 0-100 are counted in the first or last bin.
+    
+    Args:
+        scores: Total scores
+        
+    Returns:
+        Track count per bin
+    """
+    if histogram1d is not None:
+        clipped = np.clip(scores, 0, np.nextafter(100.0, 0.0))
+        return histogram1d(clipped, bins=HISTOGRAM_BINS, range=(0, 100)).astype(int).tolist()
+    
+    bin_indexes = np.clip((scores / 10).astype(np.int32), 0, HISTOGRAM_BINS - 1)
+    return np.bincount(bin_indexes, minlength=HISTOGRAM_BINS).tolist()
+
+# Playlists at least this large use the compiled kernel when numba is available;
+# below it the JIT compile costs more than it saves
+NUMBA_MIN_SCORES = 100_000
+
+def _bin_and_categorize(scores, edges, hist_out, cats_out):
+    """Histogram scores and assign each its category in one pass.
+    
+    Args:
+        scores: Total scores
+        edges: Ascending lower bounds of the categories above the lowest
+        hist_out: Zeroed per-bin counts, filled in place
+        cats_out: Category index per score, filled in place
+    """
+    last_bin = hist_out.size - 1
+    for i in range(scores.size):
+        value = scores[i]
+        
+        bin_index = int(value / 10)
+        if bin_index < 0:
+            bin_index = 0
+        elif bin_index > last_bin:
+            bin_index = last_bin
+        hist_out[bin_index] += 1
+        
+        category = 0
+        while category < edges.size and value >= edges[category]:
+            category += 1
+        cats_out[i] = category
+
+if njit is not None:
+    _bin_and_categorize = njit(nogil=True, cache=True)(_bin_and_categorize)
+
 class GemCategory(Enum):
     """Categories of hidden gems based on score."""
     DIAMOND = 4
@@ -31,6 +100,221 @@ class GemCategory(Enum):
     SAPPHIRE = 1
     QUARTZ = 0
 
+# Colors per gem category, with the gradient/border shades derived once
+_CATEGORY_COLORS = {
+    GemCategory.DIAMOND: QColor(0, 191, 255),  # Light blue for diamond
+    GemCategory.RUBY: QColor(220, 20, 60),  # Crimson for ruby
+    GemCategory.EMERALD: QColor(46, 139, 87),  # Sea green for emerald
+    GemCategory.SAPPHIRE: QColor(70, 130, 180),  # Steel blue for sapphire
+    GemCategory.QUARTZ: QColor(153, 153, 153),  # Gray for quartz
+}
+_CATEGORY_COLORS_LIGHTER = {k: v.lighter(120) for k, v in _CATEGORY_COLORS.items()}
+_CATEGORY_COLORS_DARKER = {k: v.darker(120) for k, v in _CATEGORY_COLORS.items()}
+
+def _category_gradient_brush(category: GemCategory) -> QBrush:
+    """Build the diagonal fill of a gem, relative to the shape's bounds.
+    
+    Args:
+        category: Gem category
+        
+    Returns:
+        Gradient brush for the category
+    """
+    gradient = QLinearGradient(0, 0, 1, 1)
+    gradient.setCoordinateMode(QLinearGradient.CoordinateMode.ObjectBoundingMode)
+    gradient.setColorAt(0, _CATEGORY_COLORS_LIGHTER[category])
+    gradient.setColorAt(1, _CATEGORY_COLORS[category])
+    return QBrush(gradient)
+
+_CATEGORY_GRADIENTS = {category: _category_gradient_brush(category) for category in GemCategory}
+
+# Lower score bound of each category above QUARTZ, and the category for each
+# searchsorted result against those bounds
+_CAT_EDGES = np.array([60.0, 70.0, 80.0, 90.0])
+_CAT_ORDER = (
+    GemCategory.QUARTZ, GemCategory.SAPPHIRE, GemCategory.EMERALD,
+    GemCategory.RUBY, GemCategory.DIAMOND
+)
+
+# Charts with more points than this skip series animations, which would
+# animate every point on each data load
+ANIMATION_MAX_POINTS = 500
+
+def _chart_animation_options(point_count: int) -> QChart.AnimationOption:
+    """Get the animation options for a chart of the given size.
+    
+    Args:
+        point_count: Number of data points in the chart
+        
+    Returns:
+        Series animations for small charts, no animation for large ones
+    """
+    if point_count > ANIMATION_MAX_POINTS:
+        return QChart.AnimationOption.NoAnimation
+    return QChart.AnimationOption.SeriesAnimations
+
+class _ScoreHistogramWidget(QWidget):
+    """Score histogram painted from a cached pixmap.
+    
+    The bars and axes are rendered once per data, size or style change; the
+    threshold line is drawn over the blitted pixmap on each paint.
+    """
+    
+    TITLE = "Hidden Gem Score Distribution"
+    BAR_COLOR = QColor(32, 159, 223)
+    AXIS_COLOR = QColor(160, 160, 160)
+    Y_TICKS = 5
+    
+    def __init__(self, parent=None):
+        """Initialize the histogram.
+        
+        Args:
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        
+        self._bins: List[int] = []
+        self._threshold = 0
+        self._pixmap: Optional[QPixmap] = None
+        # Plot area of the last render, used to place the threshold line
+        self._plot_rect = QRectF()
+        
+        self._threshold_pen = QPen(QColor("red"))
+        self._threshold_pen.setWidth(2)
+    
+    def set_bins(self, bins: List[int]):
+        """Set the per-bin track counts.
+        
+        Args:
+            bins: Track count per histogram bin, or empty for no data
+        """
+        self._bins = list(bins)
+        self._pixmap = None
+        self.update()
+    
+    def set_threshold(self, threshold: int):
+        """Move the threshold line.
+        
+        Args:
+            threshold: Score threshold (0-100)
+        """
+        if threshold == self._threshold:
+            return
+        
+        self._threshold = threshold
+        if self._bins:
+            self.update()
+    
+    def resizeEvent(self, event):
+        """Handle resize events.
+        
+        Args:
+            event: Resize event
+        """
+        super().resizeEvent(event)
+        self._pixmap = None
+    
+    def changeEvent(self, event):
+        """Re-render after font or palette changes.
+        
+        Args:
+            event: Change event
+        """
+        if event.type() in (QEvent.Type.FontChange, QEvent.Type.PaletteChange, QEvent.Type.StyleChange):
+            self._pixmap = None
+            self.update()
+        super().changeEvent(event)
+    
+    def paintEvent(self, event):
+        """Paint the histogram.
+        
+        Args:
+            event: Paint event
+        """
+        if self._pixmap is None:
+            self._pixmap = self._render_pixmap()
+        
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pixmap)
+        
+        if self._bins:
+            plot = self._plot_rect
+            x = plot.left() + _THRESHOLD_X[self._threshold] * plot.width() / HISTOGRAM_BINS
+            painter.setPen(self._threshold_pen)
+            painter.drawLine(QPointF(x, plot.top()), QPointF(x, plot.bottom()))
+        
+        painter.end()
+    
+    def _render_pixmap(self) -> QPixmap:
+        """Render the title, axes and bars into a pixmap.
+        
+        Returns:
+            Rendered histogram
+        """
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(max(1, int(self.width() * ratio)), max(1, int(self.height() * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(self.palette().color(QPalette.ColorRole.Base))
+        
+        painter = QPainter(pixmap)
+        metrics = painter.fontMetrics()
+        line_height = metrics.height()
+        text_color = self.palette().color(QPalette.ColorRole.Text)
+        
+        # Title
+        title_font = QFont(self.font())
+        title_font.setBold(True)
+        painter.setFont(title_font)
+        painter.setPen(text_color)
+        title_rect = QRectF(0, 4, self.width(), line_height)
+        painter.drawText(title_rect, Qt.AlignmentFlag.AlignCenter, self.TITLE)
+        painter.setFont(self.font())
+        
+        if not self._bins:
+            painter.end()
+            return pixmap
+        
+        # Plot area, leaving room for the y labels and the bin labels
+        y_max = max(self._bins) + 1
+        y_labels = [str(round(y_max * i / (self.Y_TICKS - 1))) for i in range(self.Y_TICKS)]
+        label_width = max(metrics.horizontalAdvance(label) for label in y_labels)
+        plot = QRectF(
+            label_width + 12, title_rect.bottom() + line_height,
+            self.width() - label_width - 24, self.height() - title_rect.bottom() - 3 * line_height
+        )
+        self._plot_rect = plot
+        if plot.width() <= 0 or plot.height() <= 0:
+            painter.end()
+            return pixmap
+        
+        # Y axis grid and labels
+        for i, label in enumerate(y_labels):
+            y = plot.bottom() - plot.height() * i / (self.Y_TICKS - 1)
+            painter.setPen(self.AXIS_COLOR)
+            painter.drawLine(QPointF(plot.left(), y), QPointF(plot.right(), y))
+            painter.setPen(text_color)
+            painter.drawText(
+                QRectF(0, y - line_height / 2, label_width + 6, line_height),
+                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, label
+            )
+        
+        # Bars and bin labels
+        bin_width = plot.width() / HISTOGRAM_BINS
+        for index, count in enumerate(self._bins):
+            left = plot.left() + index * bin_width
+            bar_height = plot.height() * count / y_max
+            painter.fillRect(
+                QRectF(left + bin_width * 0.1, plot.bottom() - bar_height, bin_width * 0.8, bar_height),
+                self.BAR_COLOR
+            )
+            painter.drawText(
+                QRectF(left, plot.bottom() + 4, bin_width, line_height),
+                Qt.AlignmentFlag.AlignCenter, _BIN_LABELS[index]
+            )
+        
+        painter.end()
+        return pixmap
+
 class HiddenGemsScoreView(QWidget):
     """Widget for visualizing hidden gem scores."""
     
@@ -45,6 +329,14 @@ class HiddenGemsScoreView(QWidget):
         # Data
         self.score_data = {}
         self.track_scores = []
+        # Total scores as a contiguous array and their histogram, built once
+        # per set_scores; the threshold doesn't change either
+        self._scores_array = np.empty(0)
+        self._histogram: List[int] = []
+        self._scores_sorted = np.empty(0)
+        self._cats_sorted = np.empty(0, dtype=np.intp)
+        # Set when data arrives while the view is hidden
+        self._dirty = False
         
         # Settings
         self.threshold = 50  # Score threshold (0-100)
@@ -61,8 +353,7 @@ class HiddenGemsScoreView(QWidget):
         chart_layout = QVBoxLayout()
         chart_layout.addWidget(QLabel("<b>Score Distribution</b>"))
         
-        self.chart_view = QChartView()
-        self.chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.chart_view = _ScoreHistogramWidget()
         self.chart_view.setMinimumHeight(200)
         chart_layout.addWidget(self.chart_view)
         
@@ -84,6 +375,12 @@ class HiddenGemsScoreView(QWidget):
         self.threshold_label = QLabel(f"{self.threshold}%")
         threshold_layout.addWidget(self.threshold_label)
         
+        # Threshold-dependent updates run at most once per frame while dragging
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self._apply_pending_update)
+        
         main_layout.addLayout(threshold_layout)
         
         # Category counts
@@ -136,16 +433,22 @@ class HiddenGemsScoreView(QWidget):
             slider.setMinimum(0)
             slider.setMaximum(100)
             slider.setValue(default_value)
-            slider.valueChanged.connect(self._on_weights_changed)
             weights_layout.addWidget(slider, row, 1)
             
             value_label = QLabel(f"{default_value}%")
             weights_layout.addWidget(value_label, row, 2)
+            slider.valueChanged.connect(partial(self._on_weights_changed, value_label))
             
             self.weight_sliders[name] = (slider, value_label)
             row += 1
         
         weights_group.setLayout(weights_layout)
+        
+        # Weight changes are applied at most once per frame while dragging
+        self._weights_timer = QTimer(self)
+        self._weights_timer.setSingleShot(True)
+        self._weights_timer.setInterval(16)
+        self._weights_timer.timeout.connect(self._apply_weights)
         main_layout.addWidget(weights_group)
         
         # Quick actions
@@ -161,8 +464,8 @@ class HiddenGemsScoreView(QWidget):
         
         main_layout.addLayout(actions_layout)
         
-        # Create initial empty chart
-        self._update_chart([])
+        # Show the initial empty chart
+        self._update_chart()
     
     def set_scores(self, scores: List[Dict[str, Any]]):
         """Set the hidden gem scores data.
@@ -174,14 +477,48 @@ class HiddenGemsScoreView(QWidget):
             return
             
         self.track_scores = scores
+        self._scores_array = np.fromiter(
+            (score.get('total_score', 0) for score in scores),
+            dtype=np.float64, count=len(scores)
+        )
+        
+        # Sorted scores and their categories; a threshold change is then a
+        # binary search for the cut-off plus a count over the tail
+        self._scores_sorted = np.sort(self._scores_array)
+        if njit is not None and len(scores) >= NUMBA_MIN_SCORES:
+            hist = np.zeros(HISTOGRAM_BINS, dtype=np.int64)
+            self._cats_sorted = np.empty(len(scores), dtype=np.intp)
+            _bin_and_categorize(self._scores_sorted, _CAT_EDGES, hist, self._cats_sorted)
+            self._histogram = hist.tolist()
+        else:
+            self._histogram = _score_histogram(self._scores_array)
+            self._cats_sorted = np.searchsorted(_CAT_EDGES, self._scores_sorted, side='right')
         
-        # Update chart
-        self._update_chart(scores)
+        # Hidden views catch up when shown
+        if self.isVisible():
+            self._refresh()
+        else:
+            self._dirty = True
         
-        # Update category counts
+        logger.info(f"Loaded {len(scores)} hidden gem scores")
+    
+    def _refresh(self):
+        """Update the chart and category counts from the current scores."""
+        self._update_chart()
         self._update_categories()
+    
+    def showEvent(self, event):
+        """Handle show events.
         
-        logger.info(f"Loaded {len(scores)} hidden gem scores")
+        Args:
+            event: Show event
+        """
+        super().showEvent(event)
+        
+        # Apply data that arrived while the view was hidden
+        if self._dirty:
+            self._dirty = False
+            self._refresh()
     
     def set_current_track(self, track_index: int):
         """Set the currently selected track.
@@ -193,108 +530,20 @@ class HiddenGemsScoreView(QWidget):
             self.current_track_index = track_index
             # Highlight in chart if implemented
     
-    def _update_chart(self, scores: List[Dict[str, Any]]):
-        """Update the score distribution chart.
-        
-        Args:
-            scores: List of track score data
-        """
-        # Create chart
-        chart = QChart()
-        chart.setTitle("Hidden Gem Score Distribution")
-        
-        if not scores:
-            # No data yet
-            self.chart_view.setChart(chart)
-            return
-        
-        # Extract scores
-        values = [score.get('total_score', 0) for score in scores]
-        
-        # Create histogram data (10 bins)
-        bin_count = 10
-        bin_width = 10
-        bins = [0] * bin_count
-        
-        for value in values:
-            bin_index = min(int(value / bin_width), bin_count - 1)
-            bins[bin_index] += 1
-        
-        # Create bar series
-        bar_set = QBarSet("Tracks")
-        for count in bins:
-            bar_set.append(count)
-        
-        bar_series = QBarSeries()
-        bar_series.append(bar_set)
-        chart.addSeries(bar_series)
-        
-        # Set up axes
-        axis_x = QBarCategoryAxis()
-        labels = [f"{i*10}-{(i+1)*10-1}" for i in range(bin_count)]
-        axis_x.append(labels)
-        chart.addAxis(axis_x, Qt.AlignmentFlag.AlignBottom)
-        bar_series.attachAxis(axis_x)
-        
-        axis_y = QValueAxis()
-        axis_y.setRange(0, max(bins) + 1)
-        axis_y.setLabelFormat("%d")
-        chart.addAxis(axis_y, Qt.AlignmentFlag.AlignLeft)
-        bar_series.attachAxis(axis_y)
-        
-        # Add vertical line for threshold
-        self._add_threshold_line(chart, axis_x, axis_y)
-        
-        # Set the new chart
-        self.chart_view.setChart(chart)
-    
-    def _add_threshold_line(self, chart, axis_x, axis_y):
-        """Add a vertical line to indicate threshold.
-        
-        Args:
-            chart: Chart to add line to
-            axis_x: X-axis
-            axis_y: Y-axis
-        """
-        threshold_series = QLineSeries()
-        
-        # Convert threshold to x-coordinate
-        threshold_bin = min(int(self.threshold / 10), 9)
-        threshold_x = threshold_bin + 0.5  # Center of the bin
-        
-        # Add points for vertical line
-        y_range = axis_y.max()
-        threshold_series.append(threshold_x, 0)
-        threshold_series.append(threshold_x, y_range)
-        
-        # Style the line
-        pen = QPen(QColor("red"))
-        pen.setWidth(2)
-        threshold_series.setPen(pen)
-        
-        chart.addSeries(threshold_series)
-        threshold_series.attachAxis(axis_x)
-        threshold_series.attachAxis(axis_y)
+    def _update_chart(self):
+        """Update the score distribution chart."""
+        self.chart_view.set_threshold(self.threshold)
+        self.chart_view.set_bins(self._histogram)
     
     def _update_categories(self):
         """Update category counts based on current threshold."""
-        # Count tracks in each category
-        counts = {category: 0 for category in GemCategory}
-        
-        for score_data in self.track_scores:
-            score = score_data.get('total_score', 0)
-            
-            # Skip scores below threshold
-            if score < self.threshold:
-                continue
-                
-            # Determine category
-            category = self._get_category_for_score(score)
-            counts[category] += 1
+        # Skip scores below threshold
+        cut = np.searchsorted(self._scores_sorted, self.threshold, side='left')
+        counts = np.bincount(self._cats_sorted[cut:], minlength=len(_CAT_ORDER))
         
         # Update labels
-        for category, count_label in self.category_counts.items():
-            count_label.setText(str(counts[category]))
+        for index, category in enumerate(_CAT_ORDER):
+            self.category_counts[category].setText(str(counts[index]))
     
     def _get_category_for_score(self, score: float) -> GemCategory:
         """Determine gem category for a score.
@@ -325,16 +574,7 @@ class HiddenGemsScoreView(QWidget):
         Returns:
             Color for the category
         """
-        if category == GemCategory.DIAMOND:
-            return QColor(0, 191, 255)  # Light blue for diamond
-        elif category == GemCategory.RUBY:
-            return QColor(220, 20, 60)  # Crimson for ruby
-        elif category == GemCategory.EMERALD:
-            return QColor(46, 139, 87)  # Sea green for emerald
-        elif category == GemCategory.SAPPHIRE:
-            return QColor(70, 130, 180)  # Steel blue for sapphire
-        else:
-            return QColor(153, 153, 153)  # Gray for quartz
+        return _CATEGORY_COLORS[category]
     
     @Slot(int)
     def _on_threshold_changed(self, value: int):
@@ -346,17 +586,32 @@ class HiddenGemsScoreView(QWidget):
         self.threshold = value
         self.threshold_label.setText(f"{value}%")
         
-        # Update chart and categories
-        self._update_chart(self.track_scores)
-        self._update_categories()
+        if not self._update_timer.isActive():
+            self._update_timer.start()
     
     @Slot()
-    def _on_weights_changed(self):
-        """Handle weight slider changes."""
-        # Update labels
-        for name, (slider, label) in self.weight_sliders.items():
-            label.setText(f"{slider.value()}%")
+    def _apply_pending_update(self):
+        """Apply the latest threshold to the chart and categories."""
+        # Only the threshold line and the categories depend on the threshold
+        self.chart_view.set_threshold(self.threshold)
+        self._update_categories()
+    
+    @Slot(QLabel, int)
+    def _on_weights_changed(self, label: QLabel, value: int):
+        """Handle weight slider changes.
         
+        Args:
+            label: Value label of the slider that changed
+            value: New weight
+        """
+        label.setText(f"{value}%")
+        
+        if not self._weights_timer.isActive():
+            self._weights_timer.start()
+    
+    @Slot()
+    def _apply_weights(self):
+        """Apply the current component weights."""
         # In a real implementation, this would recalculate scores
         # For now, just log the changed weights
         weights = {name: slider.value() for name, (slider, _) in self.weight_sliders.items()}
@@ -389,6 +644,8 @@ class ArtistClusterView(QWidget):
         
         # Data
         self.artist_data = []
+        # Set when data arrives while the view is hidden
+        self._dirty = False
         
         self._init_ui()
     
@@ -435,15 +692,33 @@ class ArtistClusterView(QWidget):
             data: List of artist data
         """
         self.artist_data = data
-        self._update_chart()
+        
+        # Hidden views catch up when shown
+        if self.isVisible():
+            self._update_chart()
+        else:
+            self._dirty = True
         
         logger.info(f"Artist cluster view updated with {len(data)} artists")
     
+    def showEvent(self, event):
+        """Handle show events.
+        
+        Args:
+            event: Show event
+        """
+        super().showEvent(event)
+        
+        # Apply data that arrived while the view was hidden
+        if self._dirty:
+            self._dirty = False
+            self._update_chart()
+    
     def _create_empty_chart(self):
         """Create an empty chart with instructions."""
         chart = QChart()
         chart.setTitle("Artist Clustering by Hidden Potential")
-        chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
+        chart.setAnimationOptions(_chart_animation_options(len(self.artist_data)))
         
         self.chart_view.setChart(chart)
     
@@ -469,7 +744,7 @@ class ArtistClusterView(QWidget):
         # This is just a placeholder implementation
         chart = QChart()
         chart.setTitle("Artist Clustering by Hidden Potential")
-        chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
+        chart.setAnimationOptions(_chart_animation_options(len(self.artist_data)))
         
         # In a real implementation, this would create an actual scatter plot
         # of artists based on potential and popularity
@@ -481,7 +756,7 @@ class ArtistClusterView(QWidget):
         # This is just a placeholder implementation
         chart = QChart()
         chart.setTitle("Artist Potential Bubble Chart")
-        chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
+        chart.setAnimationOptions(_chart_animation_options(len(self.artist_data)))
         
         # In a real implementation, this would create an actual bubble chart
         
@@ -492,7 +767,7 @@ class ArtistClusterView(QWidget):
         # This is just a placeholder implementation
         chart = QChart()
         chart.setTitle("Artist Potential Heat Map")
-        chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
+        chart.setAnimationOptions(_chart_animation_options(len(self.artist_data)))
         
         # In a real implementation, this would create an actual heat map
         
@@ -521,6 +796,9 @@ class GemIndicator(QWidget):
     
     clicked = Signal()
     
+    # Gem outlines shared by all indicators, keyed by (category, width, height)
+    _POLYGON_CACHE: Dict[Tuple[GemCategory, int, int], QPolygonF] = {}
+    
     def __init__(self, category: GemCategory, parent=None):
         """Initialize the gem indicator.
         
@@ -537,64 +815,120 @@ class GemIndicator(QWidget):
         self.setMinimumSize(24, 24)
         self.setMaximumSize(24, 24)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
+        
+        self._polygon = self._gem_polygon(category, self.width(), self.height())
+        # Rendered gem, rebuilt after a resize or highlight change
+        self._pixmap: Optional[QPixmap] = None
     
-    def paintEvent(self, event):
-        """Paint the gem indicator.
+    @classmethod
+    def _gem_polygon(cls, category: GemCategory, width: int, height: int) -> Optional[QPolygonF]:
+        """Get the outline of a polygonal gem, building it on first use.
         
         Args:
-            event: Paint event
+            category: Gem category
+            width: Widget width
+            height: Widget height
+            
+        Returns:
+            Gem outline, or None for the rounded gem shapes
         """
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if category not in (GemCategory.DIAMOND, GemCategory.RUBY, GemCategory.EMERALD):
+            return None
+        
+        key = (category, width, height)
+        polygon = cls._POLYGON_CACHE.get(key)
+        if polygon is not None:
+            return polygon
         
         # Get gem shape based on category
-        path = QPainterPath()
-        rect = QRectF(2, 2, self.width() - 4, self.height() - 4)
+        rect = QRectF(2, 2, width - 4, height - 4)
+        center = rect.center()
         
-        if self.category == GemCategory.DIAMOND:
+        if category == GemCategory.DIAMOND:
             # Diamond shape
-            path.moveTo(rect.center().position().position().x(), rect.top())
-            path.lineTo(rect.right(), rect.center().position().position().y())
-            path.lineTo(rect.center().position().position().x(), rect.bottom())
-            path.lineTo(rect.left(), rect.center().position().position().y())
-            path.closeSubpath()
-        elif self.category == GemCategory.RUBY:
+            points = [
+                QPointF(center.x(), rect.top()),
+                QPointF(rect.right(), center.y()),
+                QPointF(center.x(), rect.bottom()),
+                QPointF(rect.left(), center.y()),
+            ]
+        elif category == GemCategory.RUBY:
             # Ruby shape (octagon)
             third = rect.width() / 3
-            path.moveTo(rect.left() + third, rect.top())
-            path.lineTo(rect.right() - third, rect.top())
-            path.lineTo(rect.right(), rect.top() + third)
-            path.lineTo(rect.right(), rect.bottom() - third)
-            path.lineTo(rect.right() - third, rect.bottom())
-            path.lineTo(rect.left() + third, rect.bottom())
-            path.lineTo(rect.left(), rect.bottom() - third)
-            path.lineTo(rect.left(), rect.top() + third)
-            path.closeSubpath()
-        elif self.category == GemCategory.EMERALD:
-            # Emerald shape (rectangle)
-            path.addRect(rect)
-        elif self.category == GemCategory.SAPPHIRE:
-            # Sapphire shape (rounded rectangle)
-            path.addRoundedRect(rect, 5, 5)
+            points = [
+                QPointF(rect.left() + third, rect.top()),
+                QPointF(rect.right() - third, rect.top()),
+                QPointF(rect.right(), rect.top() + third),
+                QPointF(rect.right(), rect.bottom() - third),
+                QPointF(rect.right() - third, rect.bottom()),
+                QPointF(rect.left() + third, rect.bottom()),
+                QPointF(rect.left(), rect.bottom() - third),
+                QPointF(rect.left(), rect.top() + third),
+            ]
         else:
-            # Quartz shape (circle)
-            path.addEllipse(rect)
+            # Emerald shape (rectangle)
+            points = [rect.topLeft(), rect.topRight(), rect.bottomRight(), rect.bottomLeft()]
         
-        # Fill with gradient
-        gradient = QLinearGradient(rect.topLeft(), rect.bottomRight())
-        gradient.setColorAt(0, self.color.lighter(120))
-        gradient.setColorAt(1, self.color)
+        polygon = cls._POLYGON_CACHE[key] = QPolygonF(points)
+        return polygon
+    
+    def resizeEvent(self, event):
+        """Handle resize events.
+        
+        Args:
+            event: Resize event
+        """
+        super().resizeEvent(event)
+        self._polygon = self._gem_polygon(self.category, self.width(), self.height())
+        self._pixmap = None
+    
+    def paintEvent(self, event):
+        """Paint the gem indicator.
+        
+        Args:
+            event: Paint event
+        """
+        if self._pixmap is None:
+            self._pixmap = self._render_pixmap()
+        
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pixmap)
+        painter.end()
+    
+    def _render_pixmap(self) -> QPixmap:
+        """Render the gem into a pixmap that is blitted on paint.
+        
+        Returns:
+            Rendered gem
+        """
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(max(1, int(self.width() * ratio)), max(1, int(self.height() * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        rect = QRectF(2, 2, self.width() - 4, self.height() - 4)
         
         # Border
-        border_color = self.color.darker(120)
+        border_color = _CATEGORY_COLORS_DARKER[self.category]
         if self.highlight:
             border_color = Qt.GlobalColor.white
         
         painter.setPen(QPen(border_color, 2))
-        painter.setBrush(QBrush(gradient))
-        painter.drawPath(path)
+        painter.setBrush(_CATEGORY_GRADIENTS[self.category])
+        if self._polygon is not None:
+            painter.drawPolygon(self._polygon)
+        elif self.category == GemCategory.SAPPHIRE:
+            # Sapphire shape (rounded rectangle)
+            painter.drawRoundedRect(rect, 5, 5)
+        else:
+            # Quartz shape (circle)
+            painter.drawEllipse(rect)
         
         painter.end()
+        return pixmap
     
     def _get_category_color(self, category: GemCategory) -> QColor:
         """Get the color for a gem category.
@@ -605,16 +939,7 @@ class GemIndicator(QWidget):
         Returns:
             Color for the category
         """
-        if category == GemCategory.DIAMOND:
-            return QColor(0, 191, 255)  # Light blue for diamond
-        elif category == GemCategory.RUBY:
-            return QColor(220, 20, 60)  # Crimson for ruby
-        elif category == GemCategory.EMERALD:
-            return QColor(46, 139, 87)  # Sea green for emerald
-        elif category == GemCategory.SAPPHIRE:
-            return QColor(70, 130, 180)  # Steel blue for sapphire
-        else:
-            return QColor(153, 153, 153)  # Gray for quartz
+        return _CATEGORY_COLORS[category]
     
     def set_highlight(self, highlight: bool):
         """Set highlight state.
@@ -622,7 +947,11 @@ class GemIndicator(QWidget):
         Args:
             highlight: Whether to highlight the gem
         """
+        if highlight == self.highlight:
+            return
+        
         self.highlight = highlight
+        self._pixmap = None
         self.update()
     
     def mousePressEvent(self, event):
@@ -647,6 +976,8 @@ class PopularityComparisonView(QWidget):
         
         # Data
         self.track_data = []
+        # Set when data arrives while the view is hidden
+        self._dirty = False
         
         self._init_ui()
     
@@ -692,10 +1023,28 @@ class PopularityComparisonView(QWidget):
             data: List of track data with scores and popularity
         """
         self.track_data = data
-        self._update_chart()
+        
+        # Hidden views catch up when shown
+        if self.isVisible():
+            self._update_chart()
+        else:
+            self._dirty = True
         
         logger.info(f"Popularity comparison updated with {len(data)} tracks")
     
+    def showEvent(self, event):
+        """Handle show events.
+        
+        Args:
+            event: Show event
+        """
+        super().showEvent(event)
+        
+        # Apply data that arrived while the view was hidden
+        if self._dirty:
+            self._dirty = False
+            self._update_chart()
+    
     def _create_empty_chart(self):
         """Create an empty chart with instructions."""
         chart = QChart()
@@ -712,7 +1061,7 @@ class PopularityComparisonView(QWidget):
         # Create a scatter chart
         chart = QChart()
         chart.setTitle("Hidden Gems vs. Spotify Popularity")
-        chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
+        chart.setAnimationOptions(_chart_animation_options(len(self.track_data)))
         
         # In a real implementation, this would create an actual scatter chart
         # plotting gem score against Spotify popularity
@@ -753,19 +1102,86 @@ class HiddenGemsVisualization:
         # Create main container widget
         self.container = QTabWidget()
         
-        # Score visualization
-        self.score_view = HiddenGemsScoreView()
-        self.container.addTab(self.score_view, "Gem Scores")
+        # Each tab starts as an empty page; its chart view is built the first
+        # time the tab is shown
+        self._tab_views = [
+            ("Gem Scores", HiddenGemsScoreView),
+            ("Artist Clusters", ArtistClusterView),
+            ("Popularity Comparison", PopularityComparisonView),
+        ]
+        self._views: List[Optional[QWidget]] = [None] * len(self._tab_views)
+        self._pages: List[QWidget] = []
+        for title, _ in self._tab_views:
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            self.container.addTab(page, title)
+            self._pages.append(page)
+        
+        # Data for views that haven't been built yet
+        self._gems_data: Optional[Dict[str, Any]] = None
+        self._current_track = -1
+        
+        self.container.currentChanged.connect(self._ensure_view)
+        self._ensure_view(self.container.currentIndex())
         
-        # Artist clustering
-        self.artist_view = ArtistClusterView()
-        self.container.addTab(self.artist_view, "Artist Clusters")
+        logger.info("Hidden gems visualization initialized")
+    
+    def _ensure_view(self, index: int) -> QWidget:
+        """Build the view of a tab if it doesn't exist yet.
         
-        # Popularity comparison
-        self.comparison_view = PopularityComparisonView()
-        self.container.addTab(self.comparison_view, "Popularity Comparison")
+        Args:
+            index: Tab index
+            
+        Returns:
+            The tab's view
+        """
+        view = self._views[index]
+        if view is not None:
+            return view
+        
+        _, view_class = self._tab_views[index]
+        view = view_class()
+        self._views[index] = view
+        self._pages[index].layout().addWidget(view)
+        
+        # Catch up on data set before the view existed
+        if self._gems_data is not None:
+            self._apply_gems_data(index, view, self._gems_data)
+        if index == 0 and self._current_track >= 0:
+            view.set_current_track(self._current_track)
+        
+        return view
+    
+    def _apply_gems_data(self, index: int, view: QWidget, data: Dict[str, Any]):
+        """Pass hidden gems data to one tab's view.
         
-        logger.info("Hidden gems visualization initialized")
+        Args:
+            index: Tab index
+            view: The tab's view
+            data: Dictionary containing hidden gems analysis
+        """
+        if index == 0:
+            view.set_scores(data.get('track_scores', []))
+        elif index == 1:
+            view.set_artist_data(data.get('artist_data', []))
+        else:
+            view.set_track_data(data.get('track_scores', []))
+    
+    @property
+    def score_view(self) -> HiddenGemsScoreView:
+        """Get the score view, building it if needed."""
+        return self._ensure_view(0)
+    
+    @property
+    def artist_view(self) -> ArtistClusterView:
+        """Get the artist cluster view, building it if needed."""
+        return self._ensure_view(1)
+    
+    @property
+    def comparison_view(self) -> PopularityComparisonView:
+        """Get the popularity comparison view, building it if needed."""
+        return self._ensure_view(2)
     
     @property
     def widget(self) -> QWidget:
@@ -782,14 +1198,12 @@ class HiddenGemsVisualization:
         Args:
             data: Dictionary containing hidden gems analysis
         """
-        # Update score view
-        self.score_view.set_scores(data.get('track_scores', []))
-        
-        # Update artist view
-        self.artist_view.set_artist_data(data.get('artist_data', []))
+        self._gems_data = data
         
-        # Update comparison view
-        self.comparison_view.set_track_data(data.get('track_scores', []))
+        # Views that don't exist yet pick the data up when built
+        for index, view in enumerate(self._views):
+            if view is not None:
+                self._apply_gems_data(index, view, data)
         
         logger.info("Hidden gems data loaded")
     
@@ -799,4 +1213,6 @@ class HiddenGemsVisualization:
         Args:
             track_index: Index of selected track
         """
-        self.score_view.set_current_track(track_index) 
\ No newline at end of file
+        self._current_track = track_index
+        if self._views[0] is not None:
+            self._views[0].set_current_track(track_index) 
\ No newline at end of file
@@ -4,24 +4,38 @@ Log Viewer component for displaying and filtering log messages.
 
 import logging
 import re
+from collections import deque
 from enum import Enum
+from functools import cached_property
 from typing import List, Dict, Optional
 from datetime import datetime
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-    QTextEdit, QComboBox, QLineEdit, QToolBar, QFrame,
+    QTextEdit, QPlainTextEdit, QComboBox, QLineEdit, QToolBar, QFrame,
     QCheckBox, QSplitter, QMenu, QToolButton, QFileDialog, 
     QScrollArea, QSizePolicy
 )
 from PySide6.QtCore import Qt, Signal, Slot, QSize, QTimer
-from PySide6.QtGui import QTextCursor, QColor, QTextCharFormat, QAction, QIcon, QTextDocument, QAction, QAction
+from PySide6.QtGui import QTextCursor, QTextBlock, QSyntaxHighlighter, QColor, QTextCharFormat, QAction, QIcon, QTextDocument, QAction, QAction
 
 from spotify_downloader_ui.services.config_service import ConfigService
 from spotify_downloader_ui.services.error_service import ErrorService
 
 logger = logging.getLogger(__name__)
 
+# Delay before acting on search box edits, so a burst of keystrokes is handled once
+SEARCH_DEBOUNCE_MS = 150
+
+# Display lines start with an "HH:MM:SS.mmm" timestamp
+_TIMESTAMP_LENGTH = 12
+# Block user state: the entry's LogLevel value, plus this flag on group headers,
+# plus the offset of the message text in the line shifted above both
+_GROUP_HEADER_FLAG = 8
+_LEVEL_MASK = _GROUP_HEADER_FLAG - 1
+_MESSAGE_OFFSET_SHIFT = 4
+_GROUP_INDICATOR_RE = re.compile(r"\[[-+]\] ")
+
 class LogLevel(Enum):
     """Log severity levels."""
     DEBUG = 0
@@ -54,26 +68,24 @@ class LogEntry:
         self.source = source
         self.category = category
         self.group_id = None  # For collapsible groups
+        # Display strings, formatted once since entries never change
+        self.formatted_timestamp = timestamp.strftime("%H:%M:%S.%f")[:-3]
+        self.level_name = level.name
+        # Display text between the timestamp and the message
+        self._prefix = "".join((
+            self.level_name, ": ",
+            f"[{source}] " if source else "",
+            f"({category}) " if category and category != "GROUP_HEADER" else "",
+        ))
+        # Lowercased fields for case-insensitive searching and filtering
+        self._message_lower = message.lower()
+        self._source_lower = source.lower()
+        self._category_lower = category.lower()
+        # Block number of the entry's line in the log display (counting
+        # trimmed blocks), or -1 if it has none
+        self._block_number = -1
     
-    @property
-    def formatted_timestamp(self) -> str:
-        """Get formatted timestamp string.
-        
-        Returns:
-            Formatted timestamp
-        """
-        return self.timestamp.strftime("%H:%M:%S.%f")[:-3]
-    
-    @property
-    def level_name(self) -> str:
-        """Get the level name.
-        
-        Returns:
-            Level name string
-        """
-        return self.level.name
-    
-    @property
+    @cached_property
     def display_text(self) -> str:
         """Get full formatted log entry text.
         
@@ -101,6 +113,91 @@ class LogGroup:
         self.is_collapsed = False
         self.id = id(self)  # Unique ID for the group
 
+class LogHighlighter(QSyntaxHighlighter):
+    """Colors log display lines by level and marks search matches.
+    
+    Each line's block user state holds its entry's level value, with
+    _GROUP_HEADER_FLAG set on group headers, and the offset of the message
+    text above _MESSAGE_OFFSET_SHIFT.
+    """
+    
+    def __init__(self, document: QTextDocument, formats: Dict[str, QTextCharFormat]):
+        """Initialize the highlighter.
+        
+        Args:
+            document: Log display document
+            formats: Named highlight formats of the log viewer
+        """
+        super().__init__(document)
+        
+        self._timestamp_format = formats['TIMESTAMP']
+        self._group_format = formats['GROUP']
+        # Level formats indexed by LogLevel value
+        self._level_formats = tuple(formats[level.name] for level in LogLevel)
+        self._search_format = formats['SEARCH']
+        
+        # Lowercased search text and its compiled pattern, if searching
+        self._search_text_lower = ''
+        self._search_pattern: Optional[re.Pattern] = None
+    
+    def set_search_text(self, text: str) -> None:
+        """Set the text to mark in lines highlighted from now on.
+        
+        Args:
+            text: Search text, or empty for no search highlighting
+        """
+        self._search_text_lower = text.lower()
+        self._search_pattern = re.compile(re.escape(text), re.IGNORECASE) if text else None
+    
+    def highlightBlock(self, text: str) -> None:
+        """Apply the timestamp, level and group header formats to a line.
+        
+        Args:
+            text: Text of the line
+        """
+        state = self.currentBlockState()
+        if state < 0:
+            return
+        
+        self.setFormat(0, _TIMESTAMP_LENGTH, self._timestamp_format)
+        
+        # Level, source, category and message all share the level format
+        level_start = _TIMESTAMP_LENGTH + 1
+        self.setFormat(level_start, len(text) - level_start, self._level_formats[state & _LEVEL_MASK])
+        
+        if state & _GROUP_HEADER_FLAG:
+            match = _GROUP_INDICATOR_RE.search(text, level_start)
+            if match:
+                self.setFormat(match.start(), len(text) - match.start(), self._group_format)
+        
+        if self._search_text_lower:
+            self._highlight_search_matches(text, state >> _MESSAGE_OFFSET_SHIFT)
+    
+    def _highlight_search_matches(self, text: str, message_start: int) -> None:
+        """Mark each occurrence of the search text in a line's message.
+        
+        Args:
+            text: Text of the line
+            message_start: Offset of the message text in the line
+        """
+        # Most lines don't contain the search text; a substring check rules
+        # them out before looking for positions
+        needle = self._search_text_lower
+        text_lower = text.lower()
+        if needle not in text_lower:
+            return
+        
+        # Lowercasing can change the length of some characters; only then
+        # are the match positions taken from the regex
+        if len(text_lower) == len(text):
+            start = text_lower.find(needle, message_start)
+            while start != -1:
+                self.setFormat(start, len(needle), self._search_format)
+                start = text_lower.find(needle, start + len(needle))
+        else:
+            for match in self._search_pattern.finditer(text, message_start):
+                self.setFormat(match.start(), match.end() - match.start(), self._search_format)
+
 class LogViewer(QWidget):
     """Advanced log viewer component with filtering and searching."""
     
@@ -116,11 +213,6 @@ class LogViewer(QWidget):
         self.config_service = config_service
         self.error_service = error_service
         
-        # Log storage
-        self.log_entries = []
-        self.log_groups = {}
-        self.current_group = None
-        
         # Log display settings
         self.max_entries = 1000
         self.auto_scroll = True
@@ -131,11 +223,27 @@ class LogViewer(QWidget):
             'source': '',
             'category': ''
         }
+        # Value of the minimum level filter, compared against each entry
+        self._min_level_value = self.active_filters['level'].value
+        
+        # Log storage; the oldest entries drop off once max_entries is reached
+        self.log_entries = deque(maxlen=self.max_entries)
+        self.log_groups = {}
+        self.current_group = None
+        # Entries passing the current filters, in log order; recomputed
+        # when _filters_dirty is set
+        self._filtered_entries = deque()
+        self._filters_dirty = False
+        # Lines written to the display since the last rebuild; Qt trims the
+        # oldest ones once the block limit is reached
+        self._line_count = 0
         
         # UI state
         self.is_searching = False
         self.search_results = []
         self.current_result_index = -1
+        # Lowercased search text, updated with the search filter
+        self._search_text_lower = ''
         
         # Highlighting formats
         self.highlight_formats = self._create_highlight_formats()
@@ -176,6 +284,11 @@ class LogViewer(QWidget):
         self.search_box.textChanged.connect(self._on_search_text_changed)
         header_layout.addWidget(self.search_box)
         
+        self._search_debounce = QTimer(self)
+        self._search_debounce.setSingleShot(True)
+        self._search_debounce.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_debounce.timeout.connect(self._apply_search)
+        
         self.search_next_button = QPushButton("Next")
         self.search_next_button.clicked.connect(self._on_search_next)
         self.search_next_button.setEnabled(False)
@@ -220,13 +333,26 @@ class LogViewer(QWidget):
         main_layout.addLayout(header_layout)
         
         # Log display
-        self.log_display = QTextEdit()
+        # Plain text layout only lays out the blocks in view, so rebuilds and
+        # scrolling cost is bounded by the viewport rather than the log size
+        self.log_display = QPlainTextEdit()
+        self.log_display.setCenterOnScroll(False)
         self.log_display.setReadOnly(True)
-        self.log_display.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        self.log_display.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        # Read-only log; don't record every insert on the undo stack
+        self.log_display.setUndoRedoEnabled(False)
+        # Qt drops the oldest lines beyond the entry limit
+        self.log_display.setMaximumBlockCount(self.max_entries)
         self.log_display.setStyleSheet("font-family: monospace;")
         self.log_display.verticalScrollBar().valueChanged.connect(self._on_scroll_changed)
         main_layout.addWidget(self.log_display)
         
+        # Cursor for appending new entries at the end of the document
+        self._append_cursor = QTextCursor(self.log_display.document())
+        # Colors lines from their block state, so entries insert as plain text
+        self._highlighter = LogHighlighter(self.log_display.document(), self.highlight_formats)
+        self._plain_format = QTextCharFormat()
+        
         # Bottom toolbar
         toolbar = QToolBar()
         toolbar.setIconSize(QSize(16, 16))
@@ -270,10 +396,10 @@ class LogViewer(QWidget):
         
         main_layout.addWidget(toolbar)
         
-        # Set up auto-scroll timer
+        # Set up auto-scroll timer; it only runs while shown and auto-scrolling
         self.scroll_timer = QTimer(self)
+        self.scroll_timer.setInterval(500)  # Check every 500 ms
         self.scroll_timer.timeout.connect(self._check_auto_scroll)
-        self.scroll_timer.start(500)  # Check every 500 ms
     
     def _create_highlight_formats(self) -> Dict[str, QTextCharFormat]:
         """Create text formats for highlighting.
@@ -357,15 +483,24 @@ class LogViewer(QWidget):
             entry.group_id = self.current_group.id
             self.current_group.entries.append(entry)
         
+        # The oldest entry is evicted when full; drop it from the filtered
+        # entries with it. It stays in its group, so forget its line, which
+        # a later rebuild gives to another entry
+        if len(self.log_entries) == self.log_entries.maxlen:
+            oldest = self.log_entries[0]
+            oldest._block_number = -1
+            if self._filtered_entries and self._filtered_entries[0] is oldest:
+                self._filtered_entries.popleft()
+        
         # Add to main log list
         self.log_entries.append(entry)
         
-        # Trim if exceeding max
-        while len(self.log_entries) > self.max_entries:
-            self.log_entries.pop(0)
+        if not self._entry_passes_filters(entry):
+            return
+        self._filtered_entries.append(entry)
         
-        # Update display
-        self._update_log_display()
+        # Append to the display; the document is only rebuilt on filter changes
+        self._append_log_entry_to_display(entry)
     
     def start_group(self, title: str, is_collapsible: bool = True) -> None:
         """Start a new log group.
@@ -392,9 +527,11 @@ class LogViewer(QWidget):
     
     def clear_logs(self) -> None:
         """Clear all logs."""
-        self.log_entries = []
+        self.log_entries = deque(maxlen=self.max_entries)
         self.log_groups = {}
         self.current_group = None
+        self._filtered_entries = deque()
+        self._line_count = 0
         self.log_display.clear()
     
     def export_logs(self, file_path: str) -> bool:
@@ -407,9 +544,9 @@ class LogViewer(QWidget):
             True if successful, False otherwise
         """
         try:
-            with open(file_path, 'w') as f:
-                for entry in self.log_entries:
-                    f.write(f"{entry.display_text}\n")
+            # One write of the whole log through a large buffer
+            with open(file_path, 'w', buffering=1 << 20, encoding='utf-8') as f:
+                f.write("".join(f"{entry.display_text}\n" for entry in self.log_entries))
             return True
         except Exception as e:
             self.error_service.show_error(
@@ -418,72 +555,141 @@ class LogViewer(QWidget):
             )
             return False
     
-    def _update_log_display(self) -> None:
-        """Update the log display with current entries and filters."""
+    def _rebuild_log_display(self) -> None:
+        """Rebuild the log display from the current entries and filters."""
         # Remember cursor position if not auto-scrolling
         if not self.auto_scroll:
             self.last_scroll_position = self.log_display.verticalScrollBar().value()
         
         # Clear and rebuild document
         self.log_display.clear()
+        self._line_count = 0
+        for entry in self.log_entries:
+            entry._block_number = -1
+        # Evicted entries can remain in their groups
+        for group in self.log_groups.values():
+            for entry in group.entries:
+                entry._block_number = -1
         
         # Get visible entries based on filters
         visible_entries = self._get_filtered_entries()
         
-        # Create document with formatting
+        # Create document with formatting; entries in collapsed groups get
+        # hidden lines so expanding them doesn't need a rebuild. The edit
+        # block defers layout to a single pass at the end
         cursor = self.log_display.textCursor()
+        self.log_display.setUpdatesEnabled(False)
+        cursor.beginEditBlock()
+        try:
+            for entry in visible_entries:
+                self._insert_entry(cursor, entry)
+        finally:
+            cursor.endEditBlock()
+            self.log_display.setUpdatesEnabled(True)
+        
+        if self.is_searching:
+            self._collect_search_results()
+        else:
+            self.log_display.setExtraSelections([])
+        
+        self._restore_scroll_position()
+    
+    def _append_log_entry_to_display(self, entry: LogEntry) -> None:
+        """Append a single entry to the end of the log display.
+        
+        Args:
+            entry: Entry that passes the current filters
+        """
+        self._append_cursor.movePosition(QTextCursor.MoveOperation.End)
+        self._append_cursor.beginEditBlock()
+        self._insert_entry(self._append_cursor, entry)
+        self._append_cursor.endEditBlock()
+        
+        self._restore_scroll_position()
+    
+    def _entry_block(self, entry: LogEntry) -> QTextBlock:
+        """Get the display line of an entry.
         
-        # Track if we're in a collapsed group
-        in_collapsed_group = False
-        current_group_id = None
-        
-        for entry in visible_entries:
-            # Check if this is a new group or the end of a group
-            if entry.group_id != current_group_id:
-                in_collapsed_group = False
-                current_group_id = entry.group_id
-                
-                if entry.group_id in self.log_groups:
-                    group = self.log_groups[entry.group_id]
-                    in_collapsed_group = group.is_collapsed
+        Args:
+            entry: Entry with a line in the log display
             
-            # Skip entries in collapsed groups (except the header)
-            if in_collapsed_group and "GROUP_HEADER" not in entry.category:
+        Returns:
+            Text block of the entry, invalid if Qt has trimmed it
+        """
+        document = self.log_display.document()
+        trimmed = self._line_count - document.blockCount()
+        return document.findBlockByNumber(entry._block_number - trimmed)
+    
+    def _set_group_collapsed(self, group: LogGroup, collapsed: bool) -> None:
+        """Collapse or expand a group by hiding or showing its lines.
+        
+        Args:
+            group: Group to update
+            collapsed: Whether the group should be collapsed
+        """
+        if group.is_collapsed == collapsed:
+            return
+        group.is_collapsed = collapsed
+        
+        first_block = last_block = None
+        for entry in group.entries:
+            if entry._block_number < 0:
                 continue
             
-            # Format timestamp
-            cursor.insertText(entry.formatted_timestamp + " ", self.highlight_formats['TIMESTAMP'])
-            
-            # Format level
-            level_format = self.highlight_formats.get(entry.level_name, self.highlight_formats['INFO'])
-            cursor.insertText(entry.level_name + ": ", level_format)
-            
-            # Format source and category if present
-            if entry.source:
-                cursor.insertText(f"[{entry.source}] ")
-            
-            if entry.category and entry.category != "GROUP_HEADER":
-                cursor.insertText(f"({entry.category}) ")
-            
-            # Special formatting for group headers
+            block = self._entry_block(entry)
+            if not block.isValid():
+                continue
             if entry.category == "GROUP_HEADER":
-                group_id = entry.group_id
-                if group_id in self.log_groups:
-                    group = self.log_groups[group_id]
-                    collapse_indicator = "[-]" if not group.is_collapsed else "[+]"
-                    cursor.insertText(f"{collapse_indicator} {entry.message[7:]}", self.highlight_formats['GROUP'])
-                else:
-                    cursor.insertText(entry.message, level_format)
+                self._update_group_indicator(entry, block, collapsed)
             else:
-                # Format message with search highlighting if needed
-                if self.is_searching and self.active_filters['search_text']:
-                    self._insert_highlighted_text(cursor, entry.message, level_format)
-                else:
-                    cursor.insertText(entry.message, level_format)
+                block.setVisible(not collapsed)
             
-            cursor.insertBlock()
+            if first_block is None:
+                first_block = block
+            last_block = block
+        
+        # Relayout only the group's lines
+        if first_block is not None:
+            start = first_block.position()
+            end = last_block.position() + last_block.length()
+            self.log_display.document().markContentsDirty(start, end - start)
+    
+    def _update_group_indicator(self, header: LogEntry, block: QTextBlock, collapsed: bool) -> None:
+        """Replace the collapse indicator on a group header line.
+        
+        Args:
+            header: Group header entry
+            block: Display line of the header
+            collapsed: Whether the group is collapsed
+        """
+        # The indicator follows the timestamp and the level/source prefix
+        offset = len(header.formatted_timestamp) + 1 + len(header._prefix)
         
-        # Auto-scroll to bottom if enabled
+        cursor = QTextCursor(block)
+        cursor.setPosition(block.position() + offset)
+        cursor.setPosition(block.position() + offset + 3, QTextCursor.MoveMode.KeepAnchor)
+        cursor.insertText("[+]" if collapsed else "[-]", self._plain_format)
+    
+    def _set_all_groups_collapsed(self, collapsed: bool) -> None:
+        """Collapse or expand every group in the log display.
+        
+        Args:
+            collapsed: Whether the groups should be collapsed
+        """
+        # Nothing to update when grouping is unused
+        if not self.log_groups:
+            return
+        
+        for group in self.log_groups.values():
+            self._set_group_collapsed(group, collapsed)
+        
+        if self.is_searching:
+            self._collect_search_results()
+            self._update_search_buttons()
+        self.log_display.viewport().update()
+    
+    def _restore_scroll_position(self) -> None:
+        """Scroll to the bottom if auto-scrolling, else to the last position."""
         if self.auto_scroll:
             self.log_display.verticalScrollBar().setValue(
                 self.log_display.verticalScrollBar().maximum()
@@ -492,48 +698,41 @@ class LogViewer(QWidget):
             # Restore previous position
             self.log_display.verticalScrollBar().setValue(self.last_scroll_position)
     
-    def _insert_highlighted_text(self, 
-                                cursor: QTextCursor, 
-                                text: str, 
-                                base_format: QTextCharFormat) -> None:
-        """Insert text with search highlighting.
+    def _insert_entry(self, cursor: QTextCursor, entry: LogEntry) -> None:
+        """Insert a formatted entry line at the cursor.
         
         Args:
             cursor: Text cursor for insertion
-            text: Text to insert
-            base_format: Base format for non-highlighted text
+            entry: Entry to insert
         """
-        search_text = self.active_filters['search_text']
-        if not search_text:
-            cursor.insertText(text, base_format)
-            return
-        
-        # Find all occurrences of search text
-        pattern = re.escape(search_text)
-        matches = list(re.finditer(pattern, text, re.IGNORECASE))
-        
-        if not matches:
-            cursor.insertText(text, base_format)
-            return
-        
-        # Insert text with highlights
-        last_end = 0
-        for i, match in enumerate(matches):
-            # Add text before the match
-            if match.start() > last_end:
-                cursor.insertText(text[last_end:match.start()], base_format)
-            
-            # Check if this is the current search result
-            if i == self.current_result_index:
-                cursor.insertText(text[match.start():match.end()], self.highlight_formats['CURRENT_SEARCH'])
-            else:
-                cursor.insertText(text[match.start():match.end()], self.highlight_formats['SEARCH'])
-            
-            last_end = match.end()
+        # Each line after the first starts a new block
+        if self._line_count:
+            cursor.insertBlock()
         
-        # Add any remaining text after the last match
-        if last_end < len(text):
-            cursor.insertText(text[last_end:], base_format)
+        # The highlighter colors the line from its block state
+        state = entry.level.value
+        head = f"{entry.formatted_timestamp} {entry._prefix}"
+        
+        # Special formatting for group headers
+        group = self.log_groups.get(entry.group_id) if entry.category == "GROUP_HEADER" else None
+        if group is not None:
+            collapse_indicator = "[-] " if not group.is_collapsed else "[+] "
+            head += collapse_indicator
+            state |= _GROUP_HEADER_FLAG
+            cursor.insertText(head + entry.message[7:], self._plain_format)
+        else:
+            cursor.insertText(head + entry.message, self._plain_format)
+        
+        # Searching only looks at the message, after the head
+        state |= len(head) << _MESSAGE_OFFSET_SHIFT
+        block = cursor.block()
+        block.setUserState(state)
+        entry._block_number = self._line_count
+        self._line_count += 1
+        
+        # Lines of collapsed groups stay in the document, hidden
+        if self._is_hidden_by_group(entry):
+            block.setVisible(False)
     
     def _get_filtered_entries(self) -> List[LogEntry]:
         """Get log entries filtered based on current settings.
@@ -541,38 +740,55 @@ class LogViewer(QWidget):
         Returns:
             List of filtered log entries
         """
-        # Filter by log level
-        min_level = self.active_filters['level']
-        filtered_entries = [
-            entry for entry in self.log_entries
-            if entry.level.value >= min_level.value
-        ]
-        
-        # Apply text search if active
-        if self.active_filters['search_text']:
-            search_text = self.active_filters['search_text'].lower()
-            filtered_entries = [
-                entry for entry in filtered_entries
-                if search_text in entry.message.lower()
-            ]
-        
-        # Apply source filter if active
-        if self.active_filters['source']:
+        # The filtered list is kept up to date as entries come and go, and
+        # only recomputed after a filter change
+        if self._filters_dirty:
+            # One pass applying every filter, with the filter values hoisted
+            min_level = self._min_level_value
+            search_text = self._search_text_lower
             source = self.active_filters['source'].lower()
-            filtered_entries = [
-                entry for entry in filtered_entries
-                if source in entry.source.lower()
-            ]
-        
-        # Apply category filter if active
-        if self.active_filters['category']:
             category = self.active_filters['category'].lower()
-            filtered_entries = [
-                entry for entry in filtered_entries
-                if category in entry.category.lower()
-            ]
+            self._filtered_entries = deque(
+                entry for entry in self.log_entries
+                if entry.level.value >= min_level
+                and (not search_text or search_text in entry._message_lower)
+                and (not source or source in entry._source_lower)
+                and (not category or category in entry._category_lower)
+            )
+            self._filters_dirty = False
+        
+        return list(self._filtered_entries)
+    
+    def _entry_passes_filters(self, entry: LogEntry) -> bool:
+        """Check whether an entry passes the level, search, source and category filters.
         
-        return filtered_entries
+        Args:
+            entry: Log entry to check
+            
+        Returns:
+            True if the entry passes all active filters
+        """
+        if entry.level.value < self._min_level_value:
+            return False
+        if self.active_filters['search_text'] and self._search_text_lower not in entry._message_lower:
+            return False
+        if self.active_filters['source'] and self.active_filters['source'].lower() not in entry._source_lower:
+            return False
+        if self.active_filters['category'] and self.active_filters['category'].lower() not in entry._category_lower:
+            return False
+        return True
+    
+    def _is_hidden_by_group(self, entry: LogEntry) -> bool:
+        """Check whether an entry is hidden inside a collapsed group.
+        
+        Args:
+            entry: Log entry to check
+            
+        Returns:
+            True if the entry is in a collapsed group and isn't its header
+        """
+        group = self.log_groups.get(entry.group_id)
+        return group is not None and group.is_collapsed and "GROUP_HEADER" not in entry.category
     
     def _search_logs(self) -> None:
         """Search logs for the current search text."""
@@ -580,23 +796,63 @@ class LogViewer(QWidget):
             self.is_searching = False
             self.search_results = []
             self.current_result_index = -1
+            self._highlight_current_result()
             self._update_search_buttons()
             return
         
-        # Find all entries matching search
-        search_text = self.active_filters['search_text'].lower()
-        self.search_results = [
-            i for i, entry in enumerate(self.log_entries)
-            if search_text in entry.message.lower()
-        ]
+        # Refresh display; the rebuild collects the matches in the document
+        self.is_searching = True
+        self.current_result_index = 0
+        self._rebuild_log_display()
         
         # Update UI
-        self.is_searching = True
-        self.current_result_index = 0 if self.search_results else -1
         self._update_search_buttons()
+        self._show_current_result()
+    
+    def _collect_search_results(self) -> None:
+        """Collect cursors selecting each search match in the log display."""
+        search_text = self.active_filters['search_text']
+        document = self.log_display.document()
         
-        # Refresh display
-        self._update_log_display()
+        # QTextDocument.find matches case-insensitively by default
+        self.search_results = []
+        cursor = document.find(search_text)
+        while not cursor.isNull():
+            # Skip matches on lines hidden in collapsed groups, and matches in
+            # the timestamp, level, source or group indicator of a line
+            block = cursor.block()
+            if (block.isVisible()
+                    and cursor.selectionStart() - block.position() >= block.userState() >> _MESSAGE_OFFSET_SHIFT):
+                self.search_results.append(cursor)
+            cursor = document.find(search_text, cursor)
+        
+        if not self.search_results:
+            self.current_result_index = -1
+        elif not 0 <= self.current_result_index < len(self.search_results):
+            self.current_result_index = 0
+        
+        self._highlight_current_result()
+    
+    def _highlight_current_result(self) -> None:
+        """Mark the current search result with an extra selection."""
+        if not 0 <= self.current_result_index < len(self.search_results):
+            self.log_display.setExtraSelections([])
+            return
+        
+        selection = QTextEdit.ExtraSelection()
+        selection.cursor = self.search_results[self.current_result_index]
+        selection.format = self.highlight_formats['CURRENT_SEARCH']
+        self.log_display.setExtraSelections([selection])
+    
+    def _show_current_result(self) -> None:
+        """Highlight and scroll to the current search result."""
+        self._highlight_current_result()
+        
+        if 0 <= self.current_result_index < len(self.search_results):
+            # Move the caret without selecting, which would hide the highlight
+            cursor = QTextCursor(self.search_results[self.current_result_index])
+            cursor.clearSelection()
+            self.log_display.setTextCursor(cursor)
     
     def _update_search_buttons(self) -> None:
         """Update state of search navigation buttons."""
@@ -604,6 +860,32 @@ class LogViewer(QWidget):
         self.search_next_button.setEnabled(has_results and self.current_result_index < len(self.search_results) - 1)
         self.search_prev_button.setEnabled(has_results and self.current_result_index > 0)
     
+    def showEvent(self, event):
+        """Handle show events.
+        
+        Args:
+            event: Show event
+        """
+        super().showEvent(event)
+        self._update_scroll_timer()
+    
+    def hideEvent(self, event):
+        """Handle hide events.
+        
+        Args:
+            event: Hide event
+        """
+        super().hideEvent(event)
+        self.scroll_timer.stop()
+    
+    def _update_scroll_timer(self) -> None:
+        """Run the auto-scroll check only while visible and auto-scrolling."""
+        if self.auto_scroll and self.isVisible():
+            if not self.scroll_timer.isActive():
+                self.scroll_timer.start()
+        else:
+            self.scroll_timer.stop()
+    
     def _check_auto_scroll(self) -> None:
         """Check if autoscroll should be active based on user scrolling behavior."""
         if not self.auto_scroll:
@@ -612,7 +894,8 @@ class LogViewer(QWidget):
         scrollbar = self.log_display.verticalScrollBar()
         
         # If user has scrolled away from bottom, temporarily disable auto-scroll
-        if scrollbar.value() < scrollbar.maximum() - 50:
+        # (the plain text scrollbar counts lines)
+        if scrollbar.value() < scrollbar.maximum() - 3:
             self.auto_scroll = False
             self.auto_scroll_check.setChecked(False)
     
@@ -625,14 +908,30 @@ class LogViewer(QWidget):
         """
         # Update filter
         self.active_filters['level'] = LogLevel(self.level_combo.currentData())
+        self._min_level_value = self.active_filters['level'].value
+        self._filters_dirty = True
         
         # Refresh display
-        self._update_log_display()
+        self._rebuild_log_display()
+    
+    def _set_search_text(self, text: str) -> None:
+        """Set the search filter and the text the highlighter marks.
+        
+        Args:
+            text: Search text, or empty to clear the search
+        """
+        self.active_filters['search_text'] = text
+        self._search_text_lower = text.lower()
+        self._filters_dirty = True
+        
+        # Every search text change is followed by a rebuild, which
+        # highlights the new lines
+        self._highlighter.set_search_text(text)
     
     @Slot()
     def _on_search(self) -> None:
         """Handle search request."""
-        self.active_filters['search_text'] = self.search_box.text()
+        self._set_search_text(self.search_box.text())
         self._search_logs()
     
     @Slot(str)
@@ -642,14 +941,19 @@ class LogViewer(QWidget):
         Args:
             text: Current search text
         """
-        if not text:
+        self._search_debounce.start()
+    
+    @Slot()
+    def _apply_search(self) -> None:
+        """Apply the search box text once typing has paused."""
+        if not self.search_box.text():
             # Clear search
-            self.active_filters['search_text'] = ''
+            self._set_search_text('')
             self.is_searching = False
             self.search_results = []
             self.current_result_index = -1
             self._update_search_buttons()
-            self._update_log_display()
+            self._rebuild_log_display()
     
     @Slot()
     def _on_search_next(self) -> None:
@@ -660,7 +964,7 @@ class LogViewer(QWidget):
         if self.current_result_index < len(self.search_results) - 1:
             self.current_result_index += 1
             self._update_search_buttons()
-            self._update_log_display()
+            self._show_current_result()
     
     @Slot()
     def _on_search_prev(self) -> None:
@@ -670,7 +974,7 @@ class LogViewer(QWidget):
             
         self.current_result_index -= 1
         self._update_search_buttons()
-        self._update_log_display()
+        self._show_current_result()
     
     @Slot(int)
     def _on_auto_scroll_changed(self, state: int) -> None:
@@ -680,6 +984,7 @@ class LogViewer(QWidget):
             state: Checkbox state
         """
         self.auto_scroll = (state == Qt.CheckState.Checked.value)
+        self._update_scroll_timer()
         
         if self.auto_scroll:
             # Scroll to bottom
@@ -695,27 +1000,17 @@ class LogViewer(QWidget):
             state: Checkbox state
         """
         # Toggle collapsed state of all groups
-        for group in self.log_groups.values():
-            group.is_collapsed = (state == Qt.CheckState.Checked.value)
-        
-        # Refresh display
-        self._update_log_display()
+        self._set_all_groups_collapsed(state == Qt.CheckState.Checked.value)
     
     @Slot()
     def _on_expand_all(self) -> None:
         """Expand all collapsed groups."""
-        for group in self.log_groups.values():
-            group.is_collapsed = False
-        
-        self._update_log_display()
+        self._set_all_groups_collapsed(False)
     
     @Slot()
     def _on_collapse_all(self) -> None:
         """Collapse all expanded groups."""
-        for group in self.log_groups.values():
-            group.is_collapsed = True
-        
-        self._update_log_display()
+        self._set_all_groups_collapsed(True)
     
     @Slot()
     def _on_clear(self) -> None:
@@ -746,7 +1041,7 @@ class LogViewer(QWidget):
         scrollbar = self.log_display.verticalScrollBar()
         
         # If scrolled to bottom, enable auto-scroll
-        if value >= scrollbar.maximum() - 10:
+        if value >= scrollbar.maximum():
             self.auto_scroll = True
             self.auto_scroll_check.setChecked(True)
         
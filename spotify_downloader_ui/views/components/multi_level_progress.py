@@ -18,6 +18,23 @@ from PySide6.QtGui import QColor, QPalette
 
 logger = logging.getLogger(__name__)
 
+# Phase dot styles, shared so Qt isn't handed a new stylesheet string per update
+_PHASE_ACTIVE_QSS = "background-color: #2a82da; border-radius: 5px;"
+_PHASE_INACTIVE_QSS = "background-color: #e0e0e0; border-radius: 5px;"
+
+def _set_phase_dot_active(dot: QFrame, active: bool):
+    """Style a phase dot as active or inactive, skipping no-op updates.
+    
+    Args:
+        dot: Phase indicator dot
+        active: Whether the phase is active
+    """
+    if getattr(dot, "_active", None) == active:
+        return
+    
+    dot._active = active
+    dot.setStyleSheet(_PHASE_ACTIVE_QSS if active else _PHASE_INACTIVE_QSS)
+
 class ProgressLevel:
     """Constants for progress levels."""
     OVERALL = 0
@@ -199,7 +216,7 @@ class MultiLevelProgressIndicator(QWidget):
             dot.setFrameShape(QFrame.Shape.Box)
             dot.setFrameShadow(QFrame.Shadow.Plain)
             # Initial state - not active
-            dot.setStyleSheet("background-color: #e0e0e0; border-radius: 5px;")
+            _set_phase_dot_active(dot, False)
             
             phase_layout.addWidget(dot)
             self.phase_indicators[level].append(dot)
@@ -294,11 +311,7 @@ class MultiLevelProgressIndicator(QWidget):
             
         indicators = self.phase_indicators[level]
         if 0 <= phase_index < len(indicators):
-            dot = indicators[phase_index]
-            if active:
-                dot.setStyleSheet("background-color: #2a82da; border-radius: 5px;")
-            else:
-                dot.setStyleSheet("background-color: #e0e0e0; border-radius: 5px;")
+            _set_phase_dot_active(indicators[phase_index], active)
     
     def reset(self):
         """Reset all progress indicators."""
@@ -311,5 +324,5 @@ class MultiLevelProgressIndicator(QWidget):
             self.time_labels[level].setText("--:--")
             
             # Reset phase indicators
-            for i, dot in enumerate(self.phase_indicators[level]):
-                dot.setStyleSheet("background-color: #e0e0e0; border-radius: 5px;") 
\ No newline at end of file
+            for dot in self.phase_indicators[level]:
+                _set_phase_dot_active(dot, False) 
\ No newline at end of file